@@ -2,6 +2,7 @@ from PySide6.QtCore import QPointF, QRectF, Qt
 from PySide6.QtWidgets import QGraphicsItem
 from PySide6.QtGui import QPen, QBrush, QColor, QPainter, QPolygonF
 from typing import List
+import sys
 from components.path import PathNode
 
 class AGVStatus:
@@ -14,10 +15,13 @@ class AGVStatus:
     UNKNOWN = "unknown"
 
 class AGV:
+    __slots__ = ('name', 'position', 'size', 'id', 'max_speed', 'max_acc', 'max_dec',
+                 'direction', 'status', 'agv_interactions', 'port')
+
     def __init__(self, name: str, position: List[float], size: List[float]):
         # Basic properties
-        self.name = name
-        self.position = position  # Store position in meters
+        self.name = sys.intern(name) if name else name
+        self.position = (position[0], position[1])  # Store position in meters
         self.size = size  # [width, length, height] in meters
         self.id = None
         # Status properties
@@ -31,10 +35,35 @@ class AGV:
         # agv port 
         self.port = None
 
+    def set_position(self, position: List[float]):
+        """Set AGV position in meters"""
+        self.position = (position[0], position[1])
+
+    def set_direction(self, direction: float):
+        """Set AGV direction in degrees"""
+        self.direction = direction
+
+    def set_status(self, status: str):
+        """Set AGV status"""
+        self.status = status
+
+    def set_3d_size(self, width: float, length: float, height: float):
+        """Set the 3D size of the AGV in meters"""
+        self.size = [width, length, height]
     
     
 class QAGV(QGraphicsItem):
     """QAGV class for visualization"""
+    _TOOLTIP = (
+        "QAGV: {name}\n"
+        "Status: {status}\n"
+        "Speed: {speed:.3f} m/s\n"
+        "Direction: {direction:.2f}°\n"
+        "Position: ({x:.3f}, {y:.3f})"
+    )
+    _tooltip_fields = None  # Fields of the last tooltip set
+    _PEN_WIDTH = 2  # Body and arrow outline width in pixels
+
     def __init__(self, agv: AGV):
         super().__init__()
         self.agv = agv
@@ -42,74 +71,124 @@ class QAGV(QGraphicsItem):
         self.position = [self.agv.position[0], self.agv.position[1]]
         self.direction = self.agv.direction
         self.name = self.agv.name
+        self._update_bounding_rect()
 
         # Visual properties
         self.setFlag(QGraphicsItem.ItemIsSelectable)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)  # Fill option.exposedRect
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.setPos(self.agv.position[0] * 100, - self.agv.position[1] * 100)  # Convert to scene units (pixels)
+        # Rotate the item itself so Qt can reuse the cached pixmap
+        self.setRotation(-self.agv.direction)
 
         # Set default color based on status
         self.color = QColor("#4287f5")  # Default blue color
+
+        # Paint resources, built once and reused by paint()
+        self._body_pen = QPen(QColor("#000000"), self._PEN_WIDTH)
+        self._arrow_brush = QBrush(Qt.red)
+        self._arrow_pen = QPen(Qt.red, self._PEN_WIDTH)
+        self._update_paint_cache()
         
         # Update tooltip with QAGV info
         self._update_tooltip()
 
+    def _update_bounding_rect(self):
+        """Rebuild the cached body rectangle, arrow polygon and bounding rectangle from the AGV size"""
+        # Convert size from meters to scene units (pixels)
+        width = self.agv.size[0] * 100
+        length = self.agv.size[1] * 100
+        rect = QRectF(-length/2, -width/2, length, width)
+        self._body_rect = rect
+
+        arrow_length = rect.width() * 0.8  # 80% of AGV width
+        arrow_width = arrow_length * 0.3   # 30% of arrow length
+        center_x = rect.center().x()
+        center_y = rect.center().y()
+        self._arrow_poly = QPolygonF([
+            QPointF(center_x, center_y - arrow_width/2),  # Base left
+            QPointF(center_x + arrow_length/2, center_y),  # Tip
+            QPointF(center_x, center_y + arrow_width/2)   # Base right
+        ])
+
+        # The device cache clips painting to the bounding rect, so cover the
+        # outer half of the pens and an arrow wider than a narrow body
+        margin = self._PEN_WIDTH / 2
+        self._bounding_rect = rect.united(self._arrow_poly.boundingRect()).adjusted(
+            -margin, -margin, margin, margin
+        )
+
+    def _update_paint_cache(self):
+        """Rebuild the cached body brush"""
+        self._body_brush = QBrush(self.color)
+
+    def set_color(self, color: QColor):
+        """Set the body color of the QAGV"""
+        self.color = QColor(color)
+        self._update_paint_cache()
+        self.update()
+
     
     def _update_tooltip(self):
         """Update tooltip with QAGV information"""
-        self.setToolTip(
-            f"QAGV: {self.agv.name}\n"
-            f"Status: {self.agv.status}\n"
-            f"Speed: {self.agv.max_speed:.3f} m/s\n"
-            f"Direction: {self.agv.direction:.2f}°\n"
-            f"Position: ({self.agv.position[0]:.3f}, {self.agv.position[1]:.3f})"
-        )
+        agv = self.agv
+        fields = {
+            'name': agv.name,
+            'status': agv.status,
+            'speed': agv.max_speed,
+            'direction': agv.direction,
+            'x': agv.position[0],
+            'y': agv.position[1],
+        }
+        # Only reformat when something shown in the tooltip changed
+        if fields == self._tooltip_fields:
+            return
+        self._tooltip_fields = fields
+        self.setToolTip(self._TOOLTIP.format_map(fields))
     
     def boundingRect(self) -> QRectF:
         """Return the bounding rectangle of the QAGV"""
-        # Convert size from meters to scene units (pixels)
-        width = self.agv.size[0] * 100
-        length = self.agv.size[1] * 100
-        return QRectF(-length/2, -width/2, length, width)
+        return self._bounding_rect
     
     def paint(self, painter: QPainter, option, widget):
         """Paint the QAGV"""
-        # Save painter state
-        painter.save()
-        
-        # Get bounding rectangle
-        rect = self.boundingRect()
-        center = rect.center()
-        
-        # Translate to center, rotate, and translate back
-        painter.translate(center)
-        painter.rotate(-self.agv.direction)
-        painter.translate(-center)
+        # Skip painting if the exposed area does not touch the item
+        if not option.exposedRect.intersects(self._bounding_rect):
+            return
         
         # Draw AGV body
-        painter.setBrush(QBrush(self.color))
-        painter.setPen(QPen(QColor("#000000"), 2))
-        painter.drawRect(rect)
+        painter.setBrush(self._body_brush)
+        painter.setPen(self._body_pen)
+        painter.drawRect(self._body_rect)
         
         # Draw direction indicator (arrow)
-        arrow_length = rect.width() * 0.8  # 80% of AGV width
-        arrow_width = arrow_length * 0.3   # 30% of arrow length
-        
-        # Calculate arrow points
-        center_x = rect.center().x()
-        center_y = rect.center().y()
-        
-        # Draw arrow
-        painter.setBrush(QBrush(Qt.red))
-        painter.setPen(QPen(Qt.red, 2))
-        points = [
-            QPointF(center_x, center_y - arrow_width/2),  # Base left
-            QPointF(center_x + arrow_length/2, center_y),  # Tip
-            QPointF(center_x, center_y + arrow_width/2)   # Base right
-        ]
-        painter.drawPolygon(QPolygonF(points))
-        
-        # Restore painter state
-        painter.restore()
-        
-        # Update tooltip
+        painter.setBrush(self._arrow_brush)
+        painter.setPen(self._arrow_pen)
+        painter.drawPolygon(self._arrow_poly)
+
+    def set_position(self, position: List[float]):
+        """Set the position of the QAGV in meters"""
+        self.agv.set_position(position)
+        self.position = [position[0], position[1]]
+        self.setPos(position[0] * 100, - position[1] * 100)
         self._update_tooltip()
+
+    def set_direction(self, direction: float):
+        """Set the direction of the QAGV in degrees"""
+        self.agv.set_direction(direction)
+        self.direction = direction
+        self.setRotation(-direction)
+        self._update_tooltip()
+
+    def set_status(self, status: str):
+        """Set the status of the QAGV"""
+        self.agv.set_status(status)
+        self._update_tooltip()
+
+    def set_3d_size(self, width: float, length: float, height: float):
+        """Set the 3D size of the QAGV in meters"""
+        self.prepareGeometryChange()
+        self.agv.set_3d_size(width, length, height)
+        self._update_bounding_rect()
+        self._update_paint_cache()
+        self.update()
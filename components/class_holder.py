@@ -1,4 +1,6 @@
 # resources_holder.py
+from collections.abc import ValuesView
+import numpy as np
 from components.station import Station, StationType
 from components.agv import  AGV
 from components.path import  PathNode
@@ -19,25 +21,47 @@ class ClassHolder:
         self.paths = {}  # id -> Path
         self.path_nodes = {}  # id -> PathNode
         
-        # Name-based lookups
-        self.stations_by_name = {}  # name -> Station
-        self.agvs_by_name = {}  # name -> AGV
+        # Name-based lookups (the id dicts above own the objects)
+        self.station_ids_by_name = {}  # name -> station id
+        self.agv_ids_by_name = {}  # name -> AGV id
+
+        # Memoized name lookups, filled on first lookup and
+        # invalidated on add/delete
+        self._station_name_cache = {}  # name -> Station
+        self._agv_name_cache = {}  # name -> AGV
         
         # Station types
         self.station_types = {}  # name -> StationType
+
+    @staticmethod
+    def _positions_array(objects: list) -> np.ndarray:
+        """Pack the (x, y) positions of objects into an (N, 2) float64 array"""
+        return np.array([obj.position for obj in objects], dtype=np.float64).reshape(len(objects), 2)
+
+    @staticmethod
+    def poses_array(objects) -> np.ndarray:
+        """Pack the (x, y, direction) poses of objects into an (N, 3) float32 array in one pass"""
+        n = len(objects)
+        return np.fromiter(
+            (value for obj in objects for value in (obj.position[0], obj.position[1], obj.direction)),
+            dtype=np.float32, count=3 * n
+        ).reshape(n, 3)
     
     # -----------
     # Station
     # -----------
     def add_station(self, station: Station) -> Station:
         """Add a station to backend storage"""
-        if station.id is None:
-            station.id = self.station_id_manager.get_new_id()
+        station_id = station.id
+        if station_id is None:
+            station_id = station.id = next(self.station_id_manager)
         
         # Store backend object
-        self.stations[station.id] = station
-        if station.name:
-            self.stations_by_name[station.name] = station
+        self.stations[station_id] = station
+        name = station.name
+        if name:
+            self.station_ids_by_name[name] = station_id
+            self._station_name_cache.pop(name, None)
             
         return station
 
@@ -47,30 +71,74 @@ class ClassHolder:
 
     def get_station_by_name(self, name: str) -> Station:
         """Get backend station object by name"""
-        return self.stations_by_name.get(name)
+        station = self._station_name_cache.get(name)
+        if station is None:
+            station_id = self.station_ids_by_name.get(name)
+            if station_id is None:
+                return None
+            station = self.stations.get(station_id)
+            if station is not None:
+                self._station_name_cache[name] = station
+        return station
 
     def delete_station(self, station_id: int):
         """Delete backend station object"""
         station = self.stations.pop(station_id, None)
-        if station and station.name in self.stations_by_name:
-            self.stations_by_name.pop(station.name)
+        if station and self.station_ids_by_name.get(station.name) == station_id:
+            del self.station_ids_by_name[station.name]
+            self._station_name_cache.pop(station.name, None)
 
-    def get_all_stations(self) -> list[Station]:
-        """Get all backend station objects"""
+    def get_all_stations(self) -> ValuesView[Station]:
+        """Get a live read-only view of all backend station objects"""
+        return self.stations.values()
+
+    def get_all_stations_snapshot(self) -> list[Station]:
+        """Get a list copy of all backend station objects, safe to hold while adding or deleting"""
         return list(self.stations.values())
 
+    def compute_port_poses(self, stations: list[Station] = None) -> tuple[np.ndarray, np.ndarray]:
+        """Compute world port positions and directions for many stations at once
+
+        Returns an (N, 2) array of port positions in meters and an (N,)
+        array of port directions in degrees, in the order of `stations`
+        (all stations if omitted).
+        """
+        if stations is None:
+            stations = self.get_all_stations()
+        n = len(stations)
+        positions = self._positions_array(stations)
+        directions = np.fromiter((station.direction for station in stations), dtype=np.float64, count=n)
+        port_offsets = np.array(
+            [(station.station_type.port_x, station.station_type.port_y) for station in stations],
+            dtype=np.float64
+        ).reshape(n, 2)
+        port_directions = np.fromiter(
+            (station.station_type.port_direction for station in stations), dtype=np.float64, count=n
+        )
+
+        angles = np.deg2rad(directions)
+        c = np.cos(angles)
+        s = np.sin(angles)
+        port_xy = np.empty((n, 2), dtype=np.float64)
+        port_xy[:, 0] = positions[:, 0] + port_offsets[:, 0] * c - port_offsets[:, 1] * s
+        port_xy[:, 1] = positions[:, 1] + port_offsets[:, 0] * s + port_offsets[:, 1] * c
+        return port_xy, (directions + port_directions) % 360
+
     # -----------
     # AGV
     # -----------
     def add_agv(self, agv: AGV) -> AGV:
         """Add an AGV to backend storage"""
-        if agv.id is None:
-            agv.id = self.agv_id_manager.get_new_id()
+        agv_id = agv.id
+        if agv_id is None:
+            agv_id = agv.id = next(self.agv_id_manager)
         
         # Store backend object
-        self.agvs[agv.id] = agv
-        if agv.name:
-            self.agvs_by_name[agv.name] = agv
+        self.agvs[agv_id] = agv
+        name = agv.name
+        if name:
+            self.agv_ids_by_name[name] = agv_id
+            self._agv_name_cache.pop(name, None)
             
         return agv
 
@@ -80,16 +148,29 @@ class ClassHolder:
 
     def get_agv_by_name(self, name: str) -> AGV:
         """Get backend AGV object by name"""
-        return self.agvs_by_name.get(name)
+        agv = self._agv_name_cache.get(name)
+        if agv is None:
+            agv_id = self.agv_ids_by_name.get(name)
+            if agv_id is None:
+                return None
+            agv = self.agvs.get(agv_id)
+            if agv is not None:
+                self._agv_name_cache[name] = agv
+        return agv
 
     def delete_agv(self, agv_id: int):
         """Delete backend AGV object"""
         agv = self.agvs.pop(agv_id, None)
-        if agv and agv.name in self.agvs_by_name:
-            self.agvs_by_name.pop(agv.name)
+        if agv and self.agv_ids_by_name.get(agv.name) == agv_id:
+            del self.agv_ids_by_name[agv.name]
+            self._agv_name_cache.pop(agv.name, None)
+
+    def get_all_agvs(self) -> ValuesView[AGV]:
+        """Get a live read-only view of all backend AGV objects"""
+        return self.agvs.values()
 
-    def get_all_agvs(self) -> list[AGV]:
-        """Get all backend AGV objects"""
+    def get_all_agvs_snapshot(self) -> list[AGV]:
+        """Get a list copy of all backend AGV objects, safe to hold while adding or deleting"""
         return list(self.agvs.values())
 
     # -----------
@@ -97,11 +178,12 @@ class ClassHolder:
     # -----------
     def add_path_node(self, node: PathNode) -> PathNode:
         """Add a path node to backend storage"""
-        if node.id is None:
-            node.id = self.path_node_id_manager.get_new_id()
+        node_id = node.id
+        if node_id is None:
+            node_id = node.id = next(self.path_node_id_manager)
             
         # Store backend object
-        self.path_nodes[node.id] = node
+        self.path_nodes[node_id] = node
         
         return node
 
@@ -113,10 +195,18 @@ class ClassHolder:
         """Delete backend path node object"""
         self.path_nodes.pop(node_id, None)
     
-    def get_all_path_nodes(self) -> list[PathNode]:
-        """Get all backend path node objects"""
+    def get_all_path_nodes(self) -> ValuesView[PathNode]:
+        """Get a live read-only view of all backend path node objects"""
+        return self.path_nodes.values()
+
+    def get_all_path_nodes_snapshot(self) -> list[PathNode]:
+        """Get a list copy of all backend path node objects, safe to hold while adding or deleting"""
         return list(self.path_nodes.values())
 
+    def get_path_node_poses(self) -> np.ndarray:
+        """Get the (x, y, direction) poses of all path nodes as an (N, 3) float32 array"""
+        return self.poses_array(self.get_all_path_nodes())
+
     # -----------
     # StationType
     # -----------
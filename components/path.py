@@ -3,18 +3,20 @@ from PySide6.QtWidgets import (
     QGraphicsPolygonItem
 )
 from PySide6.QtGui import (
-    QPen, QBrush, QColor, QPolygonF
+    QPen, QBrush, QColor, QPolygonF, QTransform
 )
 from PySide6.QtCore import Qt, QPointF
 import math
+import sys
 
 
 class PathNode:
     """Backend data model for path nodes"""
+    __slots__ = ('position', 'connected_paths', 'id', 'direction', 'name')
     
     def __init__(self, x: float, y: float, direction: float = 0.0, id: int = None, name: str = None):
         # Store position in meters
-        self.position = [x, y]
+        self.position = (x, y)
         # Store connected paths
         self.connected_paths = []
         # Store ID
@@ -22,7 +24,7 @@ class PathNode:
         # Store direction in degrees (0 is east, 90 is north)
         self.direction = direction
         # Store the name
-        self.name = name
+        self.name = sys.intern(name) if name else name
     
     def get_position(self):
         """Get node position"""
@@ -35,6 +37,28 @@ class PathNode:
 
 class QPathNode(QGraphicsEllipseItem):
     """Node for path creation and connection"""
+
+    _TOOLTIP = (
+        "Node Position: ({x:.3f}, {y:.3f})\n"
+        "Direction: {direction:.1f}°\n"
+        "Name: {name}"
+    )
+    _tooltip_fields = None  # Fields of the last tooltip set
+
+    # Arrow properties
+    arrow_size = 8  # pixels
+    arrow_angle = 30  # degrees
+
+    # Arrow polygon for direction 0, rotated per node in _update_arrow
+    _BASE_ARROW = QPolygonF([
+        QPointF(0, 0),
+        QPointF(arrow_size, 0),
+        QPointF(-arrow_size/2 * math.cos(math.radians(arrow_angle)),
+                arrow_size/2 * math.sin(math.radians(arrow_angle))),
+        QPointF(arrow_size, 0),
+        QPointF(-arrow_size/2 * math.cos(math.radians(-arrow_angle)),
+                arrow_size/2 * math.sin(math.radians(-arrow_angle)))
+    ])
     
     def __init__(self, node: PathNode):
         # Create a 10x10 circle centered at the given position
@@ -43,13 +67,11 @@ class QPathNode(QGraphicsEllipseItem):
         y = self.node.position[1]
         # Node size
         self.node_size = 10
-        # Arrow properties
-        self.arrow_size = 8  # pixels
-        self.arrow_angle = 30  # degrees
         
         
         super().__init__(x*100 - self.node_size/2, -(y*100) - self.node_size/2, self.node_size, self.node_size)
         self.setFlag(QGraphicsItem.ItemIsSelectable)  # Only selectable, not movable
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         # Set appearance
         self.setBrush(QBrush(QColor("#666666")))
@@ -70,33 +92,25 @@ class QPathNode(QGraphicsEllipseItem):
     
     def _update_arrow(self, direction=0):
         """Update arrow shape and direction"""
-        # Calculate arrow points
-        angle = math.radians(direction)
-        
-        # Arrow endpoint
-        end_x = self.arrow_size * math.cos(angle)
-        end_y = -self.arrow_size * math.sin(angle)  # Subtract because y-axis is inverted
-        
-        # Calculate arrow head points
-        arrow_angle_rad = math.radians(self.arrow_angle)
-        arrow_p1 = QPointF(
-            -self.arrow_size/2 * math.cos(angle + arrow_angle_rad),
-            self.arrow_size/2 * math.sin(angle + arrow_angle_rad)
-        )
-        arrow_p2 = QPointF(
-            -self.arrow_size/2 * math.cos(angle - arrow_angle_rad),
-            self.arrow_size/2 * math.sin(angle - arrow_angle_rad)
-        )
-        
-        # Create arrow polygon
-        arrow_points = [QPointF(0, 0), QPointF(end_x, end_y), arrow_p1, QPointF(end_x, end_y), arrow_p2]
-        self.direction_arrow.setPolygon(QPolygonF(arrow_points))
+        # Rotate counter-clockwise on screen (y-axis is inverted)
+        transform = QTransform()
+        transform.rotate(-direction)
+        self.direction_arrow.setPolygon(transform.map(self._BASE_ARROW))
     
     def _update_tooltip(self):
         """Update tooltip with current position and direction"""
-        self.setToolTip(f"Node Position: ({self.node.position[0]:.3f}, {self.node.position[1]:.3f})\n"
-                         f"Direction: {self.node.direction:.1f}°\n"
-                         f"Name: {self.node.name}")
+        node = self.node
+        fields = {
+            'x': node.position[0],
+            'y': node.position[1],
+            'direction': node.direction,
+            'name': node.name,
+        }
+        # Only reformat when something shown in the tooltip changed
+        if fields == self._tooltip_fields:
+            return
+        self._tooltip_fields = fields
+        self.setToolTip(self._TOOLTIP.format_map(fields))
     
     def pos(self):
         """Override pos to return stored position"""
@@ -116,6 +130,13 @@ class QPathNode(QGraphicsEllipseItem):
         """Set node ID"""
         self.node.id = value
 
+    def set_position(self, x: float, y: float):
+        """Set the position of the node in meters"""
+        self.node.position = (x, y)
+        # The circle is placed through its rect in scene units, as in __init__
+        self.setRect(x*100 - self.node_size/2, -(y*100) - self.node_size/2, self.node_size, self.node_size)
+        self._update_tooltip()
+
     def set_direction(self, angle: float):
         """Set the direction of the node"""
         self.node.direction = angle
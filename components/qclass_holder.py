@@ -1,4 +1,6 @@
 # resources_holder.py
+from collections.abc import ValuesView
+from PySide6.QtWidgets import QGraphicsScene
 from components.station import QStation, Station
 from components.agv import QAGV, AGV
 from components.path import QPathNode, PathNode
@@ -14,18 +16,51 @@ class QClassHolder:
         self.qagvs = {}  # id -> QAGV
         self.qpaths = {}  # id -> QPath
         self.qpath_nodes = {}  # id -> QPathNode
+
+    def _add_items_to_scene(self, scene: QGraphicsScene, items: list):
+        """Add many items to a scene with indexing and signals suspended"""
+        index_method = scene.itemIndexMethod()
+        was_blocked = scene.blockSignals(True)
+        scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            for item in items:
+                scene.addItem(item)
+        finally:
+            # Restoring the index method rebuilds the index once
+            scene.setItemIndexMethod(index_method)
+            scene.blockSignals(was_blocked)
     
     # -----------
     # Station
     # -----------
-    def add_qstation(self, station: Station) -> QStation:
+    def add_qstation(self, station: Station, update_port: bool = True) -> QStation:
         """Add a station and create its UI representation"""
         # Create and store UI object
-        qstation = QStation(station)
+        qstation = QStation(station, update_port)
         self.qstations[station.id] = qstation
         
         return qstation
 
+    def add_qstations_bulk(self, stations: list[Station], scene: QGraphicsScene) -> list[QStation]:
+        """Create UI objects for many stations and add them to the scene at once"""
+        qstations = [self.add_qstation(station, update_port=False) for station in stations]
+        self.update_qports_bulk(qstations)
+        # The ports are built before any station is in a scene, so add them in
+        # the same batch, ahead of the stations that would otherwise add them
+        qports = [qstation.qport for qstation in qstations if qstation.qport is not None]
+        self._add_items_to_scene(scene, qports + qstations)
+        return qstations
+
+    def update_qports_bulk(self, qstations: list[QStation]):
+        """Recompute the ports of many stations with one vectorized pass"""
+        port_xy, port_directions = self.class_holder.compute_port_poses(
+            [qstation.station for qstation in qstations]
+        )
+        for qstation, (port_x, port_y), port_direction in zip(
+            qstations, port_xy.tolist(), port_directions.tolist()
+        ):
+            qstation.set_port_pose(port_x, port_y, port_direction)
+
     def get_qstation_by_id(self, station_id: int) -> QStation:
         """Get UI station object"""
         return self.qstations.get(station_id)
@@ -37,12 +72,16 @@ class QClassHolder:
             return self.qstations.get(station.id)
         return None
 
-    def delete_qstation(self, station_id: int):
-        """Delete UI station object"""
-        self.qstations.pop(station_id, None)
+    def delete_qstation(self, station_id: int) -> QStation:
+        """Delete UI station object, returning it or None if it was not stored"""
+        return self.qstations.pop(station_id, None)
+
+    def get_all_qstations(self) -> ValuesView[QStation]:
+        """Get a live read-only view of all UI station objects"""
+        return self.qstations.values()
 
-    def get_all_qstations(self) -> list[QStation]:
-        """Get all UI station objects"""
+    def get_all_qstations_snapshot(self) -> list[QStation]:
+        """Get a list copy of all UI station objects, safe to hold while adding or deleting"""
         return list(self.qstations.values())
 
     # -----------
@@ -56,6 +95,12 @@ class QClassHolder:
         
         return qagv
 
+    def add_qagvs_bulk(self, agvs: list[AGV], scene: QGraphicsScene) -> list[QAGV]:
+        """Create UI objects for many AGVs and add them to the scene at once"""
+        qagvs = [self.add_qagv(agv) for agv in agvs]
+        self._add_items_to_scene(scene, qagvs)
+        return qagvs
+
     def get_qagv_by_id(self, agv_id: int) -> QAGV:
         """Get UI AGV object"""
         return self.qagvs.get(agv_id)
@@ -71,8 +116,12 @@ class QClassHolder:
         """Delete UI AGV object"""
         self.qagvs.pop(agv_id, None)
 
-    def get_all_qagvs(self) -> list[QAGV]:
-        """Get all UI AGV objects"""
+    def get_all_qagvs(self) -> ValuesView[QAGV]:
+        """Get a live read-only view of all UI AGV objects"""
+        return self.qagvs.values()
+
+    def get_all_qagvs_snapshot(self) -> list[QAGV]:
+        """Get a list copy of all UI AGV objects, safe to hold while adding or deleting"""
         return list(self.qagvs.values())
 
     # -----------
@@ -86,6 +135,12 @@ class QClassHolder:
         
         return qnode
 
+    def add_qpath_nodes_bulk(self, nodes: list[PathNode], scene: QGraphicsScene) -> list[QPathNode]:
+        """Create UI objects for many path nodes and add them to the scene at once"""
+        qnodes = [self.add_qpath_node(node) for node in nodes]
+        self._add_items_to_scene(scene, qnodes)
+        return qnodes
+
     def get_qpath_node_by_id(self, node_id: int) -> QPathNode:
         """Get UI path node object"""
         return self.qpath_nodes.get(node_id)
@@ -94,7 +149,11 @@ class QClassHolder:
         """Delete UI path node object"""
         self.qpath_nodes.pop(node_id, None)
     
-    def get_all_qpath_nodes(self) -> list[QPathNode]:
-        """Get all UI path node objects"""
+    def get_all_qpath_nodes(self) -> ValuesView[QPathNode]:
+        """Get a live read-only view of all UI path node objects"""
+        return self.qpath_nodes.values()
+
+    def get_all_qpath_nodes_snapshot(self) -> list[QPathNode]:
+        """Get a list copy of all UI path node objects, safe to hold while adding or deleting"""
         return list(self.qpath_nodes.values())
 
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
@@ -7,12 +7,14 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import (
     QPen, QBrush, QColor, QPainter, QPolygonF
 )
-from PySide6.QtCore import Qt, QPointF
-from dataclasses import dataclass
+from PySide6.QtCore import Qt, QPointF, QRectF
 from .path import PathNode, QPathNode
 import math
+import sys
 
-@dataclass
+_DEG2RAD = math.pi / 180.0
+
+@dataclass(frozen=True, slots=True)
 class StationType:
     """Represents a type of station with its properties"""
     name: str
@@ -21,6 +23,11 @@ class StationType:
     port_x: float = 1.5
     port_y: float = 0.0
     port_direction: float = 0.0
+    # Parsed form of `color`, built once so painting never reparses the hex string
+    color_qcolor: QColor = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'color_qcolor', QColor(self.color))
 
 class StationTypeManager:
     """Manages different types of stations"""
@@ -60,17 +67,19 @@ class StationTypeManager:
 
 class Station:
     """Backend data model for stations"""
+    __slots__ = ('position', 'station_type', 'name', 'id', 'size', '_direction',
+                 '_cos_dir', '_sin_dir', 'port', 'mesh_path')
     
     def __init__(self, x: float, y: float, station_type: StationType, name: str, id: int = None):
         # Store basic properties
-        self.position = [x, y]
+        self.position = (x, y)
         self.station_type = station_type
-        self.name = name
+        self.name = sys.intern(name) if name else name
         self.id = id
-        self.station_type = station_type
         # Store 3D properties
         self.size = [1.0, 1.0, 1.0]
-        # Store direction in degrees (0 is facing right/east)
+        # Store direction in degrees (0 is facing right/east); this also
+        # fills the cached trig of the direction
         self.direction = 0.0
         self.port: PathNode = None
         self.mesh_path: str = None
@@ -80,51 +89,131 @@ class Station:
         self.size[0] = width
         self.size[1] = length
         self.size[2] = height
+
+    def set_mesh_path(self, path: str):
+        """Set the path to the STL mesh file"""
+        self.mesh_path = path
+
+    @property
+    def direction(self) -> float:
+        """Get station direction in degrees"""
+        return self._direction
+
+    @direction.setter
+    def direction(self, direction: float):
+        """Set station direction in degrees, refreshing its cached trig"""
+        self._direction = direction
+        angle = direction * _DEG2RAD
+        self._cos_dir = math.cos(angle)
+        self._sin_dir = math.sin(angle)
+
+    def set_direction(self, direction: float):
+        """Set station direction in degrees"""
+        self.direction = direction
     
 
 
 class QStation(QGraphicsRectItem):
     """Custom graphics item for stations"""
+    _TOOLTIP = (
+        "Type: {type}\n"
+        "Name: {name}\n"
+        "Position: ({x:.3f}, {y:.3f})\n"
+        "Direction: {direction:.1f}°\n"
+        "Size: {width:.3f}x{length:.3f}x{height:.3f}\n"
+        "{description}"
+    )
+    _tooltip_fields = None  # Fields of the last tooltip set
 
-    def __init__(self, station: Station):
+    def __init__(self, station: Station, update_port: bool = True):
         # Create backend station
         self.station = station
+        # Station types are immutable and never reassigned, so alias it here
+        self.station_type = station.station_type
         # Create a 40x40 rectangle centered at the scaled position (100 units = 1 meter)
         super().__init__(self.station.position[0] * 100 - station.size[1]/2 * 100, -(self.station.position[1] * 100) - station.size[0]/2 * 100, station.size[1] * 100, station.size[0] * 100)
         
+        # Paint resources, built once and reused by paint()
+        self._body_pen = QPen(Qt.black, 2)
+        self._arrow_brush = QBrush(Qt.black)
+        self._arrow_pen = QPen(Qt.black, 2)
+        self._update_paint_cache()
+
         # Set up graphics
         self.setFlag(QGraphicsItem.ItemIsSelectable)  # Only selectable, not movable
-        self.setBrush(QBrush(QColor(self.station_type.color)))
-        self.setPen(QPen(Qt.black, 2))
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)  # Fill option.exposedRect
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        # Rotate the item around its center so Qt can reuse the cached pixmap
+        self.setTransformOriginPoint(self.rect().center())
+        self.setRotation(-self.station.direction)
+        self.setBrush(self._body_brush)
+        self.setPen(self._body_pen)
         
         # Initialize port as None
         self.qport = None
-        # Create port if station type has port configuration
-        self._update_port()
+        # Create port if station type has port configuration; bulk creation
+        # skips this and sets all port poses at once via set_port_pose
+        if update_port:
+            self._update_port()
         self._update_tooltip()
 
+    def _update_paint_cache(self):
+        """Rebuild the cached body brush and arrow polygon"""
+        self._body_brush = QBrush(self.station_type.color_qcolor)
+
+        arrow_length = 30  # pixels
+        arrow_width = 10  # pixels
+        center = self.rect().center()
+        center_x = center.x()
+        center_y = center.y()
+        self._arrow_poly = QPolygonF([
+            QPointF(center_x, center_y - arrow_width/2),  # Base left
+            QPointF(center_x + arrow_length, center_y),   # Tip
+            QPointF(center_x, center_y + arrow_width/2)   # Base right
+        ])
+        # Arrow area including the pen width, used to cull arrow painting
+        pen_margin = self._arrow_pen.widthF() / 2
+        self._arrow_rect = self._arrow_poly.boundingRect().adjusted(
+            -pen_margin, -pen_margin, pen_margin, pen_margin
+        )
+        # The device cache clips painting to the bounding rect, so cover the
+        # outer half of the body pen and the fixed 30 px arrow, which
+        # overhangs stations shorter than 0.6 m
+        body_margin = self._body_pen.widthF() / 2
+        self.prepareGeometryChange()
+        self._bounding_rect = self.rect().adjusted(
+            -body_margin, -body_margin, body_margin, body_margin
+        ).united(self._arrow_rect)
+
+    def boundingRect(self) -> QRectF:
+        """Return the station body and direction arrow area including pen widths"""
+        return self._bounding_rect
+
     def _update_port(self):
         """Update the port position and create/update QPathNode"""
         if hasattr(self.station_type, 'port_x') and hasattr(self.station_type, 'port_y'):
             # calculate the port position from relative position
-            angle = self.station.direction * math.pi / 180
-            port_x = self.station.position[0] + self.station.station_type.port_x * math.cos(angle) - self.station.station_type.port_y * math.sin(angle)
-            port_y = self.station.position[1] + self.station.station_type.port_x * math.sin(angle) + self.station.station_type.port_y * math.cos(angle)
-            
-            # Create or update port node
-            port_direction = (self.station.direction + self.station.station_type.port_direction) % 360
-            if self.qport is None:
-                path_node = PathNode(port_x, port_y, port_direction, id=None, name=f"{self.station.name} Port")
-                self.qport = QPathNode(path_node)
-                # Add port to scene if station is in a scene
-                if self.scene():
-                    self.scene().addItem(self.qport)
-            else:
-                # Update existing port position and direction
-                self.qport.node.position = [port_x, port_y]
-                self.qport.node.direction = port_direction
-                self.qport.setPos(port_x * 100, -port_y * 100)
-                self.qport.direction_arrow.update_arrow(port_direction)
+            station = self.station
+            station_type = self.station_type
+            c = station._cos_dir
+            s = station._sin_dir
+            port_x = station.position[0] + station_type.port_x * c - station_type.port_y * s
+            port_y = station.position[1] + station_type.port_x * s + station_type.port_y * c
+            port_direction = (station.direction + station_type.port_direction) % 360
+            self.set_port_pose(port_x, port_y, port_direction)
+
+    def set_port_pose(self, port_x: float, port_y: float, port_direction: float):
+        """Create or update the port QPathNode at the given world pose"""
+        if self.qport is None:
+            path_node = PathNode(port_x, port_y, port_direction, id=None, name=f"{self.station.name} Port")
+            self.qport = QPathNode(path_node)
+            # Add port to scene if station is in a scene
+            if self.scene():
+                self.scene().addItem(self.qport)
+        else:
+            # Update existing port position and direction
+            self.qport.set_position(port_x, port_y)
+            self.qport.set_direction(port_direction)
 
     def pos(self):
         """Override pos to return stored position"""
@@ -132,20 +221,31 @@ class QStation(QGraphicsRectItem):
     
     def _update_tooltip(self):
         """Update tooltip with current position and information"""
+        station = self.station
         pos = self.pos()
-        self.setToolTip(
-            f"Type: {self.station.station_type.name}\n"
-            f"Name: {self.station.name}\n"
-            f"Position: ({pos[0]:.3f}, {pos[1]:.3f})\n"
-            f"Direction: {self.station.direction:.1f}°\n"
-            f"Size: {self.station.size.width:.3f}x{self.station.size.length:.3f}x{self.station.size.height:.3f}\n"
-            f"{self.station.station_type.description}"
-        )
+        fields = {
+            'type': self.station_type.name,
+            'name': station.name,
+            'x': pos[0],
+            'y': pos[1],
+            'direction': station.direction,
+            'width': station.size[0],
+            'length': station.size[1],
+            'height': station.size[2],
+            'description': self.station_type.description,
+        }
+        # Only reformat when something shown in the tooltip changed
+        if fields == self._tooltip_fields:
+            return
+        self._tooltip_fields = fields
+        self.setToolTip(self._TOOLTIP.format_map(fields))
     
     def set_3d_size(self, width: float, length: float, height: float):
         """Set the 3D size of the station"""
         self.station.set_3d_size(width, length, height)
+        self._update_paint_cache()
         self._update_tooltip()
+        self.update()
     
     def set_mesh_path(self, path: str):
         """Set the path to the STL mesh file"""
@@ -161,60 +261,33 @@ class QStation(QGraphicsRectItem):
             if self.qport and self.qport.scene():
                 self.qport.scene().removeItem(self.qport)
         elif change == QGraphicsItem.ItemSceneHasChanged:
-            # Add port to new scene
-            if self.qport and self.scene():
+            # Add port to new scene unless it was already added there
+            if self.qport and self.scene() and self.qport.scene() is not self.scene():
                 self.scene().addItem(self.qport)
         return super().itemChange(change, value)
     
     def paint(self, painter: QPainter, option, widget):
-        """Paint the station with its name, type indicator and direction"""
-        # Save painter state
-        painter.save()
-        
-        # Translate to center for rotation
-        rect = self.boundingRect()
-        center = rect.center()
-        painter.translate(center)
-        painter.rotate(-self.station.direction)
-        painter.translate(-center)
-        
+        """Paint the station body and direction indicator"""
+        exposed = option.exposedRect
+
+        # Skip painting if the exposed area does not touch the item
+        if not exposed.intersects(self._bounding_rect):
+            return
+
         # Draw the rectangle
-        painter.setBrush(QBrush(QColor(self.station_type.color)))
-        painter.setPen(QPen(Qt.black, 2))
-        painter.drawRect(rect)
-        
-        # Draw direction indicator (arrow)
-        arrow_length = 30  # pixels
-        arrow_width = 10  # pixels
-        
-        # Calculate arrow points
-        center_x = rect.center().x()
-        center_y = rect.center().y()
+        painter.setBrush(self._body_brush)
+        painter.setPen(self._body_pen)
+        painter.drawRect(self.rect())
         
-        # Draw arrow
-        painter.setBrush(QBrush(Qt.black))
-        painter.setPen(QPen(Qt.black, 2))
-        points = [
-            QPointF(center_x, center_y - arrow_width/2),  # Base left
-            QPointF(center_x + arrow_length, center_y),   # Tip
-            QPointF(center_x, center_y + arrow_width/2)   # Base right
-        ]
-        painter.drawPolygon(QPolygonF(points))
-        
-        # Draw station name and type
-        painter.resetTransform()  # Reset transform for text to be readable
-        
-        # Set up text properties
-        painter.setPen(Qt.black)
-        font = painter.font()
-        font.setBold(True)
-        painter.setFont(font)
-
-        painter.restore()
+        # Draw direction indicator (arrow) only if it is exposed
+        if exposed.intersects(self._arrow_rect):
+            painter.setBrush(self._arrow_brush)
+            painter.setPen(self._arrow_pen)
+            painter.drawPolygon(self._arrow_poly)
 
     def set_direction(self, angle: float):
         """Set the direction of the station in degrees"""
-        self.station.direction = angle
+        self.station.set_direction(angle)
+        self.setRotation(-angle)
         self._update_port()  # Update port position when direction changes
-        self._update_tooltip()
-        self.update()
\ No newline at end of file
+        self._update_tooltip()
\ No newline at end of file
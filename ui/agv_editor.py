@@ -8,6 +8,14 @@ from components.qclass_holder import QClassHolder
 from components.path import QPathNode
 class NewAGVDialog(QDialog):
     """Dialog for creating a new AGV"""
+    # (name, label, min, max, default, step, decimals, suffix) for each spin box
+    _SPIN_SPECS = (
+        ('width', "Width (m):", 0.1, 5.0, 0.5, 0.1, 3, ""),  # 0.1m to 5m
+        ('length', "Length (m):", 0.1, 5.0, 1.0, 0.1, 3, ""),
+        ('height', "Height (m):", 0.1, 5.0, 0.5, 0.1, 3, ""),
+        ('direction', "Direction:", 0, 359.99, 0.0, 15.0, 2, "°"),  # 15 degree steps for convenience
+    )
+
     def __init__(self, qclass_holder: QClassHolder = None, parent=None):
         super().__init__(parent)
         self.setWindowTitle("New AGV")
@@ -22,33 +30,19 @@ class NewAGVDialog(QDialog):
         # Add input fields
         self.name_edit = QLineEdit()
         self.name_edit.setText(f"test")
-        self.width_spin = QDoubleSpinBox()
-        self.length_spin = QDoubleSpinBox()
-        self.height_spin = QDoubleSpinBox()
-        self.direction_spin = QDoubleSpinBox()  # Add direction spinbox
-        
-        # Configure size inputs
-        for spin in [self.width_spin, self.length_spin, self.height_spin]:
-            spin.setRange(0.1, 5.0)  # 0.1m to 5m
-            spin.setDecimals(3)
-            spin.setValue(1.0)
-            spin.setSingleStep(0.1)
-        self.width_spin.setValue(0.5)
-        self.height_spin.setValue(0.5)
-        
-        # Configure direction input
-        self.direction_spin.setRange(0, 359.99)  # 0-360 degrees
-        self.direction_spin.setDecimals(2)
-        self.direction_spin.setValue(0.0)
-        self.direction_spin.setSingleStep(15.0)  # 15 degree steps for convenience
-        self.direction_spin.setSuffix("°")  # Add degree symbol
-        
-        # Add fields to layout
         layout.addRow("Name:", self.name_edit)
-        layout.addRow("Width (m):", self.width_spin)
-        layout.addRow("Length (m):", self.length_spin)
-        layout.addRow("Height (m):", self.height_spin)
-        layout.addRow("Direction:", self.direction_spin)
+        
+        # Create spin boxes from their specs, storing each as self.<name>_spin
+        for name, label, low, high, value, step, decimals, suffix in self._SPIN_SPECS:
+            spin = QDoubleSpinBox()
+            spin.setRange(low, high)
+            spin.setDecimals(decimals)
+            spin.setValue(value)
+            spin.setSingleStep(step)
+            if suffix:
+                spin.setSuffix(suffix)
+            setattr(self, f"{name}_spin", spin)
+            layout.addRow(label, spin)
         
         # Add buttons
         buttons = QDialogButtonBox(
@@ -77,6 +71,7 @@ class AGVEditor(QWidget):
         self.qclass_holder = qclass_holder
         self.class_holder = qclass_holder.class_holder
         self.map_editor = map_editor  # Store reference to map editor
+        self._last_xy = (None, None)  # Position currently shown in the labels
         self.setup_ui()
     
     def setup_ui(self):
@@ -128,7 +123,7 @@ class AGVEditor(QWidget):
                 agv_data['size']
             )
             # Set direction and other properties
-            agv.direction = agv_data['direction']  # Set the direction
+            agv.set_direction(agv_data['direction'])  # Set the direction
             agv.set_status(AGVStatus.IDLE)
             
             try:
@@ -176,9 +171,15 @@ class AGVEditor(QWidget):
     
     def update_position_display(self, pos):
         """Update the position display labels"""
-        if isinstance(pos, (list, tuple)):
-            self.pos_x_label.setText(f"{pos[0]:.3f}")
-            self.pos_y_label.setText(f"{pos[1]:.3f}")
-        else:
-            self.pos_x_label.setText(f"{pos.x():.3f}")
-            self.pos_y_label.setText(f"{pos.y():.3f}") 
\ No newline at end of file
+        try:
+            xy = (pos[0], pos[1])
+        except TypeError:
+            # QPointF and similar point types
+            xy = (pos.x(), pos.y())
+        
+        # Skip the label relayout when the shown position is unchanged
+        if xy == self._last_xy:
+            return
+        self._last_xy = xy
+        self.pos_x_label.setText(f"{xy[0]:.3f}")
+        self.pos_y_label.setText(f"{xy[1]:.3f}") 
\ No newline at end of file
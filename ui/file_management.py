@@ -1,9 +1,67 @@
+import os
 from xml.etree import ElementTree as ET
-from xml.dom import minidom
+from xml.sax.saxutils import escape
+from PySide6.QtWidgets import QGraphicsScene
 from components.station import Station, StationType
 from components.path import PathNode
 from components.agv import AGV
 
+# Pretty-printed per-record XML templates, written straight to the file
+_STATION_TYPE_TMPL = (
+    "    <station_type>\n"
+    "      <name>{name}</name>\n"
+    "      <color>{color}</color>\n"
+    "      <description>{description}</description>\n"
+    "    </station_type>\n"
+)
+_STATION_TMPL = (
+    "    <station>\n"
+    "      <id>{id}</id>\n"
+    "      <name>{name}</name>\n"
+    "      <x>{x}</x>\n"
+    "      <y>{y}</y>\n"
+    "      <type>{type}</type>\n"
+    "      <direction>{direction}</direction>\n"
+    "      <size>\n"
+    "        <width>{width}</width>\n"
+    "        <length>{length}</length>\n"
+    "        <height>{height}</height>\n"
+    "        <mesh_path>{mesh_path}</mesh_path>\n"
+    "      </size>\n"
+    "    </station>\n"
+)
+_NODE_TMPL = (
+    "    <node>\n"
+    "      <id>{id}</id>\n"
+    "      <x>{x}</x>\n"
+    "      <y>{y}</y>\n"
+    "      <direction>{direction}</direction>\n"
+    "    </node>\n"
+)
+_AGV_TMPL = (
+    "    <agv>\n"
+    "      <id>{id}</id>\n"
+    "      <name>{name}</name>\n"
+    "      <x>{x}</x>\n"
+    "      <y>{y}</y>\n"
+    "      <direction>{direction}</direction>\n"
+    "      <status>{status}</status>\n"
+    "      <size>\n"
+    "        <width>{width}</width>\n"
+    "        <length>{length}</length>\n"
+    "        <height>{height}</height>\n"
+    "      </size>\n"
+    "    </agv>\n"
+)
+
+def _text(value) -> str:
+    """Escape an optional string for use as element text"""
+    return escape(value) if value else ""
+
+def _child_texts(elem) -> dict:
+    """Map each child tag of an element to its text in one pass over the children"""
+    return {child.tag: child.text for child in elem}
+
 class MapExporter:
     """Exports map elements to XML file"""
     def __init__(self, map_editor):
@@ -13,74 +71,87 @@ class MapExporter:
 
     def save_map(self, file_path):
         """Save map elements to XML file"""
-        # Create root element
-        root = ET.Element("map")
-        
-        # Add map size
-        map_size = ET.SubElement(root, "map_size")
-        map_size.text = str(self.map_editor.map_size)
-        
-        # Add station types
-        station_types = ET.SubElement(root, "station_types")
-        for station_type in self.map_editor.station_manager.get_all_types().values():
-            type_elem = ET.SubElement(station_types, "station_type")
-            ET.SubElement(type_elem, "name").text = station_type.name
-            ET.SubElement(type_elem, "color").text = station_type.color
-            ET.SubElement(type_elem, "description").text = station_type.description
-        
-        # Add stations
-        stations = ET.SubElement(root, "stations")
-        for station in self.class_holder.get_all_stations():
-            station_elem = ET.SubElement(stations, "station")
-            ET.SubElement(station_elem, "id").text = str(station.id)
-            ET.SubElement(station_elem, "name").text = station.name
-            ET.SubElement(station_elem, "x").text = str(station.position[0])
-            ET.SubElement(station_elem, "y").text = str(station.position[1])
-            ET.SubElement(station_elem, "type").text = station.station_type.name
-            ET.SubElement(station_elem, "direction").text = str(station.direction)
-            # Add 3D size
-            size_elem = ET.SubElement(station_elem, "size")
-            ET.SubElement(size_elem, "width").text = str(station.size.width)
-            ET.SubElement(size_elem, "length").text = str(station.size.length)
-            ET.SubElement(size_elem, "height").text = str(station.size.height)
-            ET.SubElement(size_elem, "mesh_path").text = station.size.mesh_path
-        
-        # Add path nodes
-        nodes = ET.SubElement(root, "path_nodes")
-        for node in self.class_holder.get_all_path_nodes():
-            node_elem = ET.SubElement(nodes, "node")
-            ET.SubElement(node_elem, "id").text = str(node.id)
-            ET.SubElement(node_elem, "x").text = str(node.position[0])
-            ET.SubElement(node_elem, "y").text = str(node.position[1])
-            ET.SubElement(node_elem, "direction").text = str(node.direction)
-        
-        # Add AGVs
-        agvs = ET.SubElement(root, "agvs")
-        for agv in self.class_holder.get_all_agvs():
-            agv_elem = ET.SubElement(agvs, "agv")
-            ET.SubElement(agv_elem, "id").text = str(agv.id)
-            ET.SubElement(agv_elem, "name").text = agv.name
-            ET.SubElement(agv_elem, "x").text = str(agv.position[0])
-            ET.SubElement(agv_elem, "y").text = str(agv.position[1])
-            ET.SubElement(agv_elem, "direction").text = str(agv.direction)
-            ET.SubElement(agv_elem, "status").text = agv.status
-            # Add size
-            size_elem = ET.SubElement(agv_elem, "size")
-            ET.SubElement(size_elem, "width").text = str(agv.size[0])
-            ET.SubElement(size_elem, "length").text = str(agv.size[1])
-            ET.SubElement(size_elem, "height").text = str(agv.size[2])
-            # Add latest node if exists
-            if agv.latest_node:
-                ET.SubElement(agv_elem, "latest_node_id").text = str(agv.latest_node.id)
-        
-        # Create pretty XML string
-        xml_str = ET.tostring(root, encoding='utf-8')
-        dom = minidom.parseString(xml_str)
-        pretty_xml = dom.toprettyxml(indent="  ")
-        
-        # Save to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(pretty_xml)
+        # Write records as they are formatted, so no tree is built in memory;
+        # go through a temporary file so a failed save keeps the old map
+        tmp_path = file_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                write = f.write
+                write("<?xml version='1.0' encoding='utf-8'?>\n<map>\n")
+            
+                # Add map size
+                write(f"  <map_size>{self.map_editor.map_size}</map_size>\n")
+            
+                # Add station types
+                write("  <station_types>\n")
+                station_type_fmt = _STATION_TYPE_TMPL.format
+                for station_type in self.map_editor.station_manager.get_all_types().values():
+                    write(station_type_fmt(
+                        name=_text(station_type.name),
+                        color=_text(station_type.color),
+                        description=_text(station_type.description),
+                    ))
+                write("  </station_types>\n")
+            
+                # Add stations
+                write("  <stations>\n")
+                station_fmt = _STATION_TMPL.format
+                for station in self.class_holder.get_all_stations():
+                    position = station.position
+                    size = station.size
+                    write(station_fmt(
+                        id=station.id,
+                        name=_text(station.name),
+                        x=position[0],
+                        y=position[1],
+                        type=_text(station.station_type.name),
+                        direction=station.direction,
+                        width=size[0],
+                        length=size[1],
+                        height=size[2],
+                        mesh_path=_text(station.mesh_path),
+                    ))
+                write("  </stations>\n")
+            
+                # Add path nodes
+                write("  <path_nodes>\n")
+                node_fmt = _NODE_TMPL.format
+                for node in self.class_holder.get_all_path_nodes():
+                    position = node.position
+                    write(node_fmt(
+                        id=node.id,
+                        x=position[0],
+                        y=position[1],
+                        direction=node.direction,
+                    ))
+                write("  </path_nodes>\n")
+            
+                # Add AGVs
+                write("  <agvs>\n")
+                agv_fmt = _AGV_TMPL.format
+                for agv in self.class_holder.get_all_agvs():
+                    position = agv.position
+                    size = agv.size
+                    write(agv_fmt(
+                        id=agv.id,
+                        name=_text(agv.name),
+                        x=position[0],
+                        y=position[1],
+                        direction=agv.direction,
+                        status=_text(agv.status),
+                        width=size[0],
+                        length=size[1],
+                        height=size[2],
+                    ))
+                write("  </agvs>\n")
+            
+                write("</map>\n")
+            os.replace(tmp_path, file_path)
+        except Exception:
+            # Do not leave a partial temporary file next to the map
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
 
 
@@ -93,136 +164,209 @@ class MapLoader:
 
     def load_map(self, file_path):
         """Load map elements from XML file"""
-        # Parse XML file
-        tree = ET.parse(file_path)
-        root = tree.getroot()
+        scene = self.map_editor.scene
         
-        # Clear existing data
-        self.clear_existing_data()
+        # Parse the whole file before touching the current map, so a malformed
+        # or truncated file raises here and leaves the loaded map intact
+        records = self._parse_elements(file_path)
         
-        # Load map size
-        map_size = int(root.find('map_size').text)
-        self.map_editor.map_size = map_size
-        self.map_editor.map_size_spin.setValue(map_size)
+        # Suspend scene indexing and signals for the whole load, so the index
+        # is rebuilt once and views repaint once when it finishes
+        index_method = scene.itemIndexMethod()
+        was_blocked = scene.blockSignals(True)
+        scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            # Clear existing data
+            self.clear_existing_data()
+            
+            self._load_elements(records)
+            
+            # Redraw grid
+            self.map_editor._draw_grid()
+        finally:
+            scene.blockSignals(was_blocked)
+            # Resize the scene once signals are live, so views see sceneRectChanged,
+            # and before indexing resumes, so the index is built for the final rect
+            self.map_editor.update_scene_rect()
+            scene.setItemIndexMethod(index_method)
+            scene.update()
         
-        # Load station types
-        station_types = root.find('station_types')
-        for type_elem in station_types.findall('station_type'):
-            station_type = StationType(
-                name=type_elem.find('name').text,
-                color=type_elem.find('color').text,
-                description=type_elem.find('description').text
-            )
-            self.map_editor.station_manager.add_type(station_type)
+        # Emit map changed signal
+        self.map_editor.map_changed.emit()
+    
+    def _parse_elements(self, file_path) -> list:
+        """Parse the map file into (tag, record) pairs of plain values, in file order"""
+        parsers = {
+            'node': self._parse_node,
+            'station': self._parse_station,
+            'agv': self._parse_agv,
+            'station_type': self._parse_station_type,
+        }
+        sections = ('station_types', 'path_nodes', 'stations', 'agvs')
+        records = []
         
-        # Update station types list in UI
-        self.map_editor.update_station_types_list()
+        # Stream the file and convert each record as soon as it is complete,
+        # clearing it afterwards so the element tree is never held in memory.
+        # The plain records do grow with the map; that is accepted so a parse
+        # error leaves the current map untouched
+        for _, elem in ET.iterparse(file_path, events=('end',)):
+            tag = elem.tag
+            parser = parsers.get(tag)
+            if parser is not None:
+                records.append((tag, parser(elem)))
+                elem.clear()
+            elif tag == 'map_size':
+                records.append((tag, int(elem.text)))
+            elif tag in sections:
+                records.append((tag, None))
+                elem.clear()
+        return records
+    
+    def _load_elements(self, records: list):
+        """Add parsed map records to the holders and scene"""
+        scene = self.map_editor.scene
+        loaded_nodes = []
+        loaded_stations = []
+        loaded_agvs = []
         
-        # Load path nodes first (needed for AGV references)
-        nodes = root.find('path_nodes')
-        node_dict = {}  # Store nodes for AGV reference
-        for node_elem in nodes.findall('node'):
-            node_id = int(node_elem.find('id').text)
-            x = float(node_elem.find('x').text)
-            y = float(node_elem.find('y').text)
-            direction = float(node_elem.find('direction').text)
-            
-            # Create backend node
-            node = PathNode(x, y, node_id)
-            node = self.class_holder.add_path_node(node)
-            
-            # Create UI node and add to scene
-            qnode = self.qclass_holder.add_path_node(node)
-            qnode.set_direction(direction)
-            self.map_editor.scene.addItem(qnode)
-            
-            # Store for AGV reference
-            node_dict[node_id] = node
+        for tag, record in records:
+            if tag == 'node':
+                loaded_nodes.append(self._load_node(record))
+            elif tag == 'station':
+                station = self._load_station(record)
+                if station is not None:
+                    loaded_stations.append(station)
+            elif tag == 'agv':
+                loaded_agvs.append(self._load_agv(record))
+            elif tag == 'station_type':
+                self.map_editor.station_manager.add_type(StationType(**record))
+            elif tag == 'map_size':
+                # Load map size
+                self.map_editor.map_size = record
+                self.map_editor.map_size_spin.setValue(record)
+            elif tag == 'station_types':
+                # Update station types list in UI
+                self.map_editor.update_station_types_list()
+            elif tag == 'path_nodes':
+                # Create UI nodes and add them to the scene in one batch
+                self.qclass_holder.add_qpath_nodes_bulk(loaded_nodes, scene)
+            elif tag == 'stations':
+                # Create UI stations and add them to the scene in one batch
+                self.qclass_holder.add_qstations_bulk(loaded_stations, scene)
+            elif tag == 'agvs':
+                # Create UI AGVs and add them to the scene in one batch
+                self.qclass_holder.add_qagvs_bulk(loaded_agvs, scene)
+    
+    def _parse_station_type(self, type_elem) -> dict:
+        """Parse a station type XML element into StationType arguments"""
+        fields = _child_texts(type_elem)
+        return {
+            'name': fields['name'],
+            'color': fields['color'],
+            'description': fields['description'],
+        }
+    
+    def _parse_node(self, node_elem) -> dict:
+        """Parse a path node XML element into plain values"""
+        fields = _child_texts(node_elem)
+        return {
+            'id': int(fields['id']),
+            'x': float(fields['x']),
+            'y': float(fields['y']),
+            'direction': float(fields['direction']),
+        }
+    
+    def _parse_station(self, station_elem) -> dict:
+        """Parse a station XML element into plain values"""
+        fields = _child_texts(station_elem)
+        size = _child_texts(station_elem.find('size'))
+        return {
+            'id': int(fields['id']),
+            'name': fields['name'],
+            'type': fields['type'],
+            'x': float(fields['x']),
+            'y': float(fields['y']),
+            'direction': float(fields['direction']),
+            'width': float(size['width']),
+            'length': float(size['length']),
+            'height': float(size['height']),
+            'mesh_path': size['mesh_path'],
+        }
+    
+    def _parse_agv(self, agv_elem) -> dict:
+        """Parse an AGV XML element into plain values"""
+        fields = _child_texts(agv_elem)
+        size = _child_texts(agv_elem.find('size'))
+        return {
+            'id': int(fields['id']),
+            'name': fields['name'],
+            'x': float(fields['x']),
+            'y': float(fields['y']),
+            'direction': float(fields['direction']),
+            'status': fields['status'],
+            'width': float(size['width']),
+            'length': float(size['length']),
+            'height': float(size['height']),
+        }
+    
+    def _load_node(self, record: dict) -> PathNode:
+        """Load a parsed path node into backend storage"""
+        # Create backend node
+        node = PathNode(record['x'], record['y'], record['direction'], id=record['id'])
+        return self.class_holder.add_path_node(node)
+    
+    def _load_station(self, record: dict) -> Station:
+        """Load a parsed station into backend storage, None if its type is unknown"""
+        # Get station type
+        station_type = self.map_editor.station_manager.get_type(record['type'])
+        if not station_type:
+            return None
         
-        # Load stations
-        stations = root.find('stations')
-        for station_elem in stations.findall('station'):
-            station_id = int(station_elem.find('id').text)
-            name = station_elem.find('name').text
-            x = float(station_elem.find('x').text)
-            y = float(station_elem.find('y').text)
-            type_name = station_elem.find('type').text
-            direction = float(station_elem.find('direction').text)
-            
-            # Get station type
-            station_type = self.map_editor.station_manager.get_type(type_name)
-            if not station_type:
-                continue
-            
-            # Create backend station
-            station = Station(x, y, station_type, name, station_id)
-            station.direction = direction
-            
-            # Set 3D size
-            size_elem = station_elem.find('size')
-            station.set_3d_size(
-                float(size_elem.find('width').text),
-                float(size_elem.find('length').text),
-                float(size_elem.find('height').text)
-            )
-            station.size.mesh_path = size_elem.find('mesh_path').text
-            
-            # Create UI station and add to scene
-            qstation = self.qclass_holder.add_station(station)
-            self.map_editor.scene.addItem(qstation)
+        # Create backend station
+        station = Station(
+            record['x'],
+            record['y'],
+            station_type,
+            record['name'],
+            record['id']
+        )
+        station.set_direction(record['direction'])
         
-        # Load AGVs
-        agvs = root.find('agvs')
-        for agv_elem in agvs.findall('agv'):
-            agv_id = int(agv_elem.find('id').text)
-            name = agv_elem.find('name').text
-            x = float(agv_elem.find('x').text)
-            y = float(agv_elem.find('y').text)
-            direction = float(agv_elem.find('direction').text)
-            status = agv_elem.find('status').text
-            
-            # Get size
-            size_elem = agv_elem.find('size')
-            size = [
-                float(size_elem.find('width').text),
-                float(size_elem.find('length').text),
-                float(size_elem.find('height').text)
-            ]
-            
-            # Create backend AGV
-            agv = AGV(name, [x, y], size)
-            agv.id = agv_id
-            agv.direction = direction
-            agv.status = status
-            
-            # Set latest node if exists
-            latest_node_elem = agv_elem.find('latest_node_id')
-            if latest_node_elem is not None:
-                node_id = int(latest_node_elem.text)
-                if node_id in node_dict:
-                    agv.set_latest_node(node_dict[node_id])
-            
-            # Create UI AGV and add to scene
-            qagv = self.qclass_holder.add_agv(agv)
-            self.map_editor.scene.addItem(qagv)
+        # Set 3D size
+        station.set_3d_size(record['width'], record['length'], record['height'])
+        station.set_mesh_path(record['mesh_path'])
         
-        # Redraw grid
-        self.map_editor.update_scene_rect()
-        self.map_editor._draw_grid()
+        # Add to backend storage
+        return self.class_holder.add_station(station)
+    
+    def _load_agv(self, record: dict) -> AGV:
+        """Load a parsed AGV into backend storage"""
+        # Create backend AGV
+        agv = AGV(
+            record['name'],
+            [record['x'], record['y']],
+            [record['width'], record['length'], record['height']]
+        )
+        agv.id = record['id']
+        agv.set_direction(record['direction'])
+        agv.set_status(record['status'])
         
-        # Emit map changed signal
-        self.map_editor.map_changed.emit()
+        # Add to backend storage
+        return self.class_holder.add_agv(agv)
     
     def clear_existing_data(self):
         """Clear all existing data from scene and holders"""
-        # Clear scene
+        # Clear scene; this also deletes the axis items
         self.map_editor.scene.clear()
+        self.map_editor._axis_items = []
         
         # Clear backend holders
         self.class_holder.stations.clear()
-        self.class_holder.stations_by_name.clear()
+        self.class_holder.station_ids_by_name.clear()
+        self.class_holder._station_name_cache.clear()
         self.class_holder.agvs.clear()
-        self.class_holder.agvs_by_name.clear()
+        self.class_holder.agv_ids_by_name.clear()
+        self.class_holder._agv_name_cache.clear()
         self.class_holder.path_nodes.clear()
         
         # Clear UI holders
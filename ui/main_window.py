@@ -2,11 +2,10 @@ from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTabWidget, QPushButton, QToolBar, QStatusBar
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, QTimer
 from PySide6.QtGui import QAction, QIcon
 
 from ui.map_editor import MapEditor
-from ui.realtime_view import RealtimeView
 from components.qclass_holder import QClassHolder
 from components.class_holder import ClassHolder
 
@@ -48,12 +47,14 @@ class MainWindow(QMainWindow):
             }
         """)
         
+        # Coalesce map changes into at most one 3D view update per frame
+        self._map_update_timer = QTimer(self)
+        self._map_update_timer.setSingleShot(True)
+        self._map_update_timer.setInterval(16)
+        self._map_update_timer.timeout.connect(self._update_paths_and_nodes)
+        
         # Connect signals
-        self.map_editor.map_changed.connect(self._update_paths_and_nodes)
-        self.map_editor.station_added.connect(self.realtime_view.update_station)
-        self.map_editor.station_modified.connect(self.realtime_view.update_station)
-        self.map_editor.station_removed.connect(self.realtime_view.remove_station)
-        self.map_editor.map_size_changed.connect(self.realtime_view.update_map_size)
+        self.map_editor.map_changed.connect(self._schedule_map_update)
     
     def _create_central_widget(self):
         """Create and set up the central widget with tabs"""
@@ -70,9 +71,46 @@ class MainWindow(QMainWindow):
         self.map_editor = MapEditor(self.qclass_holder)
         self.tab_widget.addTab(self.map_editor, "Map Editor")
         
-        # Add Real-time View tab with resources holder
+        # Add Real-time View tab; the OpenGL view is only built when the tab
+        # is first shown, keeping OpenGL and trimesh off the startup path
+        self.realtime_view = None
+        self._realtime_placeholder = QWidget()
+        self.tab_widget.addTab(self._realtime_placeholder, "Real-time View")
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
+    
+    @Slot(int)
+    def _on_tab_changed(self, index):
+        """Build the real-time view the first time its tab is shown"""
+        if self.realtime_view is None and self.tab_widget.widget(index) is self._realtime_placeholder:
+            self._load_realtime_view()
+    
+    def _load_realtime_view(self):
+        """Create the real-time view, swap it in for the placeholder and wire it up"""
+        from ui.realtime_view import RealtimeView
+        
         self.realtime_view = RealtimeView(self.qclass_holder)
-        self.tab_widget.addTab(self.realtime_view, "Real-time View")
+        index = self.tab_widget.indexOf(self._realtime_placeholder)
+        
+        # Swap the tabs without re-entering _on_tab_changed
+        was_blocked = self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, self.realtime_view, "Real-time View")
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(was_blocked)
+        self._realtime_placeholder.deleteLater()
+        self._realtime_placeholder = None
+        
+        # Catch up on changes made before the view existed
+        self.realtime_view.update_map_size(self.map_editor.map_size)
+        for qstation in self.qclass_holder.get_all_qstations():
+            if qstation.station.mesh_path:
+                self.realtime_view.update_station(qstation)
+        
+        # Connect signals
+        self.map_editor.station_added.connect(self.realtime_view.update_station)
+        self.map_editor.station_modified.connect(self.realtime_view.update_station)
+        self.map_editor.station_removed.connect(self.realtime_view.remove_station)
+        self.map_editor.map_size_changed.connect(self.realtime_view.update_map_size)
     
     def _create_toolbar(self):
         """Create and set up the toolbar"""
@@ -111,8 +149,14 @@ class MainWindow(QMainWindow):
             self.map_editor.load_map()
             self.statusBar.showMessage("Map loaded successfully", 3000)
 
+    @Slot()
+    def _schedule_map_update(self):
+        """Restart the debounce timer for the 3D view update"""
+        self._map_update_timer.start()
+
     @Slot()
     def _update_paths_and_nodes(self):
         """Update paths and nodes in the 3D view"""
         # Force realtime view to update from resources holder
-        self.realtime_view.gl_widget.update()
\ No newline at end of file
+        if self.realtime_view is not None:
+            self.realtime_view.gl_widget.update()
\ No newline at end of file
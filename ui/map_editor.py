@@ -1,14 +1,20 @@
+import os
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QGraphicsView, QGraphicsScene, QColorDialog,
     QInputDialog, QMessageBox, QListWidget, QLabel,
     QDialog, QLineEdit, QFormLayout, QDialogButtonBox,
-    QSpinBox, QListWidgetItem, QFrame, QFileDialog,
+    QSpinBox, QListWidgetItem, QFileDialog,
     QStackedWidget, QButtonGroup, QDoubleSpinBox,
-    QTableWidget, QTableWidgetItem, QHeaderView
+    QHeaderView,
+    QStyledItemDelegate, QStyle, QApplication, QTableView, QStyleOptionButton,
+    QCheckBox
 )
-from PySide6.QtCore import Qt, Signal,  QPointF
-from PySide6.QtGui import QPen, QColor, QPainter, QBrush, QPolygonF
+from PySide6.QtCore import (
+    Qt, Signal,  QPointF, QRectF, QTimer, QSize, QRect,
+    QAbstractTableModel, QModelIndex, QEvent, QSettings
+)
+from PySide6.QtGui import QPen, QColor, QPainter, QBrush, QPolygonF, QPixmap, QTransform, QFont
 from components.station import QStation, Station
 from components.path import QPathNode, PathNode
 from components.station import StationType, StationTypeManager
@@ -81,80 +87,173 @@ class StationTypeItem(QListWidgetItem):
     """List widget item representing a station type"""
     def __init__(self, station_type: StationType, parent=None):
         super().__init__(parent)
+        self.set_station_type(station_type)
+    
+    def set_station_type(self, station_type: StationType):
+        """Show a different station type, letting the delegate repaint the row"""
         self.station_type = station_type
-        # self.setText(station_type.name)
         self.setToolTip(station_type.description)
-        
-        # Create the custom widget for display
-        self.custom_widget = StationTypeWidget(station_type)
-        self.setSizeHint(self.custom_widget.sizeHint())
+        # Read back by StationTypeDelegate when painting
+        self.setData(Qt.UserRole, station_type)
 
-class StationTypeWidget(QWidget):
-    """Widget for displaying station type in list"""
-    def __init__(self, station_type: StationType, parent=None):
-        super().__init__(parent)
-        self.station_type = station_type
-        self.setup_ui()
+class StationTypeDelegate(QStyledItemDelegate):
+    """Paints a station type row as a color swatch with name and description"""
+    SWATCH_SIZE = 20
+    ROW_HEIGHT = 50
     
-    def setup_ui(self):
-        layout = QHBoxLayout(self)
+    def paint(self, painter, option, index):
+        station_type = index.data(Qt.UserRole)
+        if station_type is None:
+            super().paint(painter, option, index)
+            return
         
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(20)  # Add spacing between elements
+        # Selection and hover background from the current style
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+        
+        painter.save()
+        rect = option.rect.adjusted(5, 5, -5, -5)
         
         # Color indicator
-        color_frame = QFrame()
-        color_frame.setFixedSize(20, 20)
-        color_frame.setStyleSheet(
-            f"background-color: {self.station_type.color}; "
-            f"border: 1px solid black; border-radius: 2px;"
-        )
-        layout.addWidget(color_frame)
+        swatch = QRect(rect.left(), rect.center().y() - self.SWATCH_SIZE // 2,
+                       self.SWATCH_SIZE, self.SWATCH_SIZE)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(Qt.black, 1))
+        painter.setBrush(station_type.color_qcolor)
+        painter.drawRoundedRect(swatch, 2, 2)
         
         # Type name and description
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(1)  # Reduce spacing between name and description
-        
-        name_label = QLabel(f"<b>{self.station_type.name}</b>")
-        name_label.setStyleSheet("color: black;")  # Ensure text is visible
-        
-        desc_label = QLabel(self.station_type.description)
-        desc_label.setStyleSheet("color: #666666;")  # Gray color for description
-        desc_label.setWordWrap(False)
-        
-        info_layout.addWidget(name_label)
-        info_layout.addWidget(desc_label)
-        layout.addLayout(info_layout)
-        layout.addStretch()
-        
-        # Set fixed height to prevent overlap
-        self.setMinimumHeight(50)
+        text_rect = rect.adjusted(self.SWATCH_SIZE + 20, 0, 0, 0)
+        name_rect = QRect(text_rect.left(), text_rect.top(), text_rect.width(), text_rect.height() // 2)
+        desc_rect = QRect(text_rect.left(), name_rect.bottom() + 1, text_rect.width(), text_rect.height() - name_rect.height())
+        
+        font = QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(Qt.black)
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignBottom, station_type.name)
+        
+        painter.setFont(option.font)
+        painter.setPen(QColor("#666666"))  # Gray color for description
+        painter.drawText(desc_rect, Qt.AlignLeft | Qt.AlignTop, station_type.description)
+        painter.restore()
+    
+    def sizeHint(self, option, index):
+        return QSize(200, self.ROW_HEIGHT)
+
+class StationsTableModel(QAbstractTableModel):
+    """Read-only table model over a list of UI stations"""
+    HEADERS = ["Name", "Type", "X", "Y", "Delete"]
+    READONLY_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    
+    def __init__(self, qstations, parent=None):
+        super().__init__(parent)
+        # Rows are removed one at a time as stations are deleted, so keep our own list
+        self._qstations = qstations if isinstance(qstations, list) else list(qstations)
+        self._row_texts = {}  # station id -> formatted cell texts
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._qstations)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._texts(self._qstations[index.row()])[index.column()]
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        return self.READONLY_FLAGS
+    
+    def qstation(self, row: int) -> QStation:
+        """Get the UI station shown in a row"""
+        return self._qstations[row]
+    
+    def remove_row(self, row: int):
+        """Remove a single station row, letting views repaint only that row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        qstation = self._qstations.pop(row)
+        self._row_texts.pop(qstation.station.id, None)
+        self.endRemoveRows()
+    
+    def _texts(self, qstation: QStation) -> tuple:
+        """Get the cell texts for a station, formatting them once"""
+        station = qstation.station
+        texts = self._row_texts.get(station.id)
+        if texts is None:
+            x, y = station.position[0], station.position[1]
+            texts = self._row_texts[station.id] = (
+                station.name, station.station_type.name, f"{x:.2f}", f"{y:.2f}", "Delete"
+            )
+        return texts
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Paints cells as push buttons and reports clicks by row"""
+    clicked = Signal(int)
+    
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = index.data(Qt.DisplayRole)
+        button.state = QStyle.State_Enabled | QStyle.State_Raised
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and option.rect.contains(event.position().toPoint()):
+            self.clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
 
 class ZoomableGraphicsView(QGraphicsView):
     """Custom QGraphicsView with zoom and pan support"""
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, map_editor=None):
         super().__init__(parent)
+        self.map_editor = map_editor  # Gets first pick of mouse presses
         self.setRenderHint(QPainter.Antialiasing)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Repaint only dirty regions; the grid background is cached per zoom level
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        # Items leave the painter clean themselves, so skip per-item save/restore
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
         self.setDragMode(QGraphicsView.RubberBandDrag)
         
-        # Set dark background color
-        self.setBackgroundBrush(QBrush(QColor("#1e1e1e")))  # Dark gray background
-        
         self.zoom_factor = 1.15
         self.panning = False
         self.last_mouse_pos = None
+        
+        # Wheel ticks accumulate here and are applied at most once per frame
+        self._pending_zoom = 1.0
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(16)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
     
     def wheelEvent(self, event):
         """Handle mouse wheel events for zooming"""
         if event.angleDelta().y() > 0:
-            self.scale(self.zoom_factor, self.zoom_factor)
+            self._pending_zoom *= self.zoom_factor
         else:
-            self.scale(1 / self.zoom_factor, 1 / self.zoom_factor)
+            self._pending_zoom /= self.zoom_factor
+        event.accept()
+        if not self._zoom_timer.isActive():
+            self._zoom_timer.start()
+    
+    def _apply_zoom(self):
+        """Apply the zoom accumulated since the last frame"""
+        zoom = self._pending_zoom
+        self._pending_zoom = 1.0
+        self.scale(zoom, zoom)
     
     def mousePressEvent(self, event):
         """Handle mouse press events"""
@@ -164,6 +263,9 @@ class ZoomableGraphicsView(QGraphicsView):
             self.last_mouse_pos = event.pos()
             self.setCursor(Qt.ClosedHandCursor)
             event.accept()
+        elif self.map_editor is not None and self.map_editor.handle_mouse_press(event):
+            # The editor consumed the press
+            event.accept()
         else:
             super().mousePressEvent(event)
     
@@ -204,6 +306,9 @@ class MapEditor(QWidget):
     station_removed = Signal(object)  # Signal emitted when a station is removed
     map_size_changed = Signal(int)  # Signal emitted when map size changes
     
+    # Axis arrowhead with its tip at the origin pointing along +x, scaled and placed per axis
+    _UNIT_ARROW = QPolygonF([QPointF(-1, -0.5), QPointF(0, 0), QPointF(-1, 0.5)])
+    
     def __init__(self, qclass_holder: QClassHolder):
         super().__init__()
         self.qclass_holder = qclass_holder
@@ -214,16 +319,16 @@ class MapEditor(QWidget):
         self.current_path = None
         self.first_node = None  # For path connection
         self.map_size = 10  # Map size in meters (half-width/height)
+        self._grid_pixmap = None  # One grid cell, tiled as the scene background
+        self._type_items: dict[str, StationTypeItem] = {}  # type name -> list item
+        self._axis_items = []  # Axis lines, arrows and labels drawn by _draw_grid
+        self._node_dir_dialog = None  # Built on first use by _get_node_direction_dialog
+        self._add_node_dialog = None  # Built on first use by _get_add_node_dialog
+        # Remember where meshes were last loaded from across sessions
+        self._settings = QSettings("TalosMapEditor", "TalosMapEditor")
+        self._last_mesh_dir = self._settings.value("last_mesh_dir", "")
+        self._confirm_station_delete = self._settings.value("confirm_station_delete", True, type=bool)
         self.setup_ui()
-        
-        # Set up custom event handling
-        self.view.original_mouse_press = self.view.mousePressEvent
-        self.view.original_mouse_release = self.view.mouseReleaseEvent
-        self.view.original_mouse_move = self.view.mouseMoveEvent
-        
-        self.view.mousePressEvent = self.handle_mouse_press
-        self.view.mouseReleaseEvent = self.handle_mouse_release
-        self.view.mouseMoveEvent = self.handle_mouse_move
     
     def setup_ui(self):
         """Set up the user interface"""
@@ -239,41 +344,24 @@ class MapEditor(QWidget):
         toolbar.setSpacing(5)
         map_layout.addLayout(toolbar)
         
-        # Mode buttons styling
-        button_style = """
-            QPushButton {
-                background-color: #2196F3;
-                color: black;
-                border: none;
-                padding: 5px 15px;
-                border-radius: 4px;
-            }
-            QPushButton:checked {
-                background-color: #1976D2;
-            }
-            QPushButton:hover {
-                background-color: #42A5F5;
-            }
-        """
-        
-        # Add mode buttons
+        # Add mode buttons, styled through the "modeButton" rules in get_style_sheet
         self.station_btn = QPushButton("QStation Mode")
         self.station_btn.setCheckable(True)
         self.station_btn.setChecked(True)
-        self.station_btn.clicked.connect(lambda: self.set_mode("station"))
-        self.station_btn.setStyleSheet(button_style)
+        self.station_btn.clicked.connect(self._set_station_mode)
+        self.station_btn.setObjectName("modeButton")
         toolbar.addWidget(self.station_btn)
         
         self.path_btn = QPushButton("QPath Mode")
         self.path_btn.setCheckable(True)
-        self.path_btn.clicked.connect(lambda: self.set_mode("path"))
-        self.path_btn.setStyleSheet(button_style)
+        self.path_btn.clicked.connect(self._set_path_mode)
+        self.path_btn.setObjectName("modeButton")
         toolbar.addWidget(self.path_btn)
         
         self.agv_btn = QPushButton("QAGV Mode")
         self.agv_btn.setCheckable(True)
-        self.agv_btn.clicked.connect(lambda: self.set_mode("agv"))
-        self.agv_btn.setStyleSheet(button_style)
+        self.agv_btn.clicked.connect(self._set_agv_mode)
+        self.agv_btn.setObjectName("modeButton")
         toolbar.addWidget(self.agv_btn)
         
         # Add map size control
@@ -282,12 +370,17 @@ class MapEditor(QWidget):
         self.map_size_spin = QSpinBox()
         self.map_size_spin.setRange(5, 100)  # Allow maps from 5m to 100m
         self.map_size_spin.setValue(self.map_size)
-        self.map_size_spin.valueChanged.connect(self.update_map_size)
+        # Only apply the size once the spin box has settled
+        self._map_size_timer = QTimer(self)
+        self._map_size_timer.setSingleShot(True)
+        self._map_size_timer.setInterval(200)
+        self._map_size_timer.timeout.connect(self._apply_map_size)
+        self.map_size_spin.valueChanged.connect(self._schedule_map_size_update)
         toolbar.addWidget(self.map_size_spin)
         
         # Create graphics view
         self.scene = QGraphicsScene(self)
-        self.view = ZoomableGraphicsView()
+        self.view = ZoomableGraphicsView(map_editor=self)
         self.view.setScene(self.scene)
         map_layout.addWidget(self.view)
         
@@ -318,6 +411,7 @@ class MapEditor(QWidget):
         station_layout.addWidget(new_type_btn)
         
         self.type_list = QListWidget()
+        self.type_list.setItemDelegate(StationTypeDelegate(self.type_list))
         self.update_station_types_list()
         station_layout.addWidget(self.type_list)
         
@@ -390,7 +484,20 @@ class MapEditor(QWidget):
         show_stations_btn.clicked.connect(self.show_stations_table)
         station_layout.addWidget(show_stations_btn)
         
-        # QPath tools
+        # Add tools to stack; the path and AGV pages are built on first use
+        self.tools_stack.addWidget(station_tools)
+        self.tools_stack.addWidget(QWidget())
+        self.tools_stack.addWidget(QWidget())
+        self._tools_built = {0: True, 1: False, 2: False}
+        self.agv_editor = None
+        
+        main_layout.addLayout(panel_layout, stretch=1)
+        
+        # Apply styling
+        self.setStyleSheet(self.get_style_sheet())
+    
+    def _build_path_tools(self) -> QWidget:
+        """Build the path mode tool page"""
         path_tools = QWidget()
         path_layout = QVBoxLayout(path_tools)
         
@@ -417,18 +524,23 @@ class MapEditor(QWidget):
         add_node_pos_btn.clicked.connect(self.add_path_node_by_position)
         path_layout.addWidget(add_node_pos_btn)
         
-        # Add tools to stack
-        self.tools_stack.addWidget(station_tools)
-        self.tools_stack.addWidget(path_tools)
-        
-        # Add QAGV tools
+        return path_tools
+    
+    def _build_agv_tools(self) -> QWidget:
+        """Build the AGV mode tool page"""
         self.agv_editor = AGVEditor(self.qclass_holder, self)  # Pass self (MapEditor) as parent
-        self.tools_stack.addWidget(self.agv_editor)
-        
-        main_layout.addLayout(panel_layout, stretch=1)
-        
-        # Apply styling
-        self.setStyleSheet(self.get_style_sheet())
+        return self.agv_editor
+    
+    def _show_tools_page(self, index: int):
+        """Show a tool page, building it the first time it is needed"""
+        if not self._tools_built[index]:
+            build = self._build_path_tools if index == 1 else self._build_agv_tools
+            placeholder = self.tools_stack.widget(index)
+            self.tools_stack.insertWidget(index, build())
+            self.tools_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self._tools_built[index] = True
+        self.tools_stack.setCurrentIndex(index)
     
     def get_style_sheet(self):
         """Get the style sheet for the widget"""
@@ -451,12 +563,34 @@ class MapEditor(QWidget):
             QPushButton:checked {
                 background-color: #388E3C;
             }
+            QPushButton#modeButton {
+                background-color: #2196F3;
+                color: black;
+            }
+            QPushButton#modeButton:checked {
+                background-color: #1976D2;
+            }
+            QPushButton#modeButton:hover {
+                background-color: #42A5F5;
+            }
             QListWidget {
                 border: 1px solid #CCCCCC;
                 border-radius: 4px;
             }
         """
     
+    def _set_station_mode(self):
+        """Switch to station mode"""
+        self.set_mode("station")
+    
+    def _set_path_mode(self):
+        """Switch to path mode"""
+        self.set_mode("path")
+    
+    def _set_agv_mode(self):
+        """Switch to AGV mode"""
+        self.set_mode("agv")
+    
     def set_mode(self, mode):
         """Set the current editing mode"""
         # Reset path connection if changing modes
@@ -471,14 +605,14 @@ class MapEditor(QWidget):
         
         # Switch tool panel
         if mode == "station":
-            self.tools_stack.setCurrentIndex(0)
+            self._show_tools_page(0)
             self.current_path = None
             self.view.setDragMode(QGraphicsView.RubberBandDrag)
         elif mode == "path":
-            self.tools_stack.setCurrentIndex(1)
+            self._show_tools_page(1)
             self.view.setDragMode(QGraphicsView.NoDrag)
         else:  # QAGV mode
-            self.tools_stack.setCurrentIndex(2)
+            self._show_tools_page(2)
             self.view.setDragMode(QGraphicsView.RubberBandDrag)
     
     def set_path_tool(self, button):
@@ -489,92 +623,98 @@ class MapEditor(QWidget):
         elif tool_id == 1:  # Delete Node
             self.path_tool = "delete"
     
-    def handle_mouse_press(self, event):
-        """Handle mouse press events"""
-        if event.button() == Qt.MiddleButton:
-            # Let the view handle panning
-            self.view.original_mouse_press(event)
-            return
+    def _get_node_direction_dialog(self):
+        """Get the reusable node direction dialog and its direction spin box"""
+        if self._node_dir_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("Set Node Direction")
+            dialog.setModal(True)
+            
+            layout = QFormLayout(dialog)
+            direction_input = QDoubleSpinBox()
+            direction_input.setRange(0, 359.99)
+            direction_input.setDecimals(2)
+            direction_input.setSuffix("°")
+            direction_input.setSingleStep(15.0)
+            layout.addRow("Direction:", direction_input)
+            
+            buttons = QDialogButtonBox(
+                QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+            )
+            buttons.accepted.connect(dialog.accept)
+            buttons.rejected.connect(dialog.reject)
+            layout.addRow(buttons)
+            
+            self._node_dir_dialog = (dialog, direction_input)
+        return self._node_dir_dialog
+    
+    def _path_node_at(self, pos: QPointF) -> QPathNode:
+        """Get the topmost path node within a few units of a scene position, or None"""
+        rect = QRectF(pos.x() - 3, pos.y() - 3, 6, 6)
+        for item in self.scene.items(rect, Qt.IntersectsItemBoundingRect, Qt.DescendingOrder, self.view.transform()):
+            if isinstance(item, QPathNode):
+                return item
+            # The direction arrow is a child of its node
+            parent = item.parentItem()
+            if isinstance(parent, QPathNode):
+                return parent
+        return None
+    
+    def handle_mouse_press(self, event) -> bool:
+        """Handle non-panning mouse presses on the view, returning True if consumed"""
+        if self.current_mode != "path":
+            # Let the view handle selection in other modes
+            return False
         
         pos = self.view.mapToScene(event.pos())
         
-        if self.current_mode == "path":
-            if event.button() == Qt.LeftButton:
-                if self.path_tool == "add":
-                    # Show direction input dialog
-                    dialog = QDialog(self)
-                    dialog.setWindowTitle("Set Node Direction")
-                    dialog.setModal(True)
-                    
-                    layout = QFormLayout(dialog)
-                    direction_input = QDoubleSpinBox()
-                    direction_input.setRange(0, 359.99)
-                    direction_input.setDecimals(2)
-                    direction_input.setSuffix("°")
-                    direction_input.setSingleStep(15.0)
-                    layout.addRow("Direction:", direction_input)
-                    
-                    buttons = QDialogButtonBox(
-                        QDialogButtonBox.Ok | QDialogButtonBox.Cancel
-                    )
-                    buttons.accepted.connect(dialog.accept)
-                    buttons.rejected.connect(dialog.reject)
-                    layout.addRow(buttons)
-                    
-                    if dialog.exec_() == QDialog.Accepted:
-                        # Create backend PathNode first
-                        node = PathNode(pos.x()/100, -pos.y()/100, direction=direction_input.value(), id=self.class_holder.path_node_id_manager.get_new_id())
-                        node = self.class_holder.add_path_node(node)
-                        try:
-                            # Add to resources holder and get UI object
-                            qnode = self.qclass_holder.add_qpath_node(node)
-                            # Set direction after creating UI object
-                            qnode.set_direction(direction_input.value())
-                            # Add to scene
-                            self.scene.addItem(qnode)
-                            self.map_changed.emit()
-                        except ValueError as e:
-                            QMessageBox.warning(self, "Error", str(e))
+        if event.button() == Qt.LeftButton:
+            if self.path_tool == "add":
+                # Show direction input dialog
+                dialog, direction_input = self._get_node_direction_dialog()
+                direction_input.setValue(0.0)
                 
-                elif self.path_tool == "delete":
-                    # Find and delete clicked node or path
-                    item = self.scene.itemAt(pos, self.view.transform())
-                    if isinstance(item, QPathNode):
-                        try:
-                            # Remove node
-                            self.qclass_holder.delete_qpath_node(item.node.id)
-                            self.class_holder.delete_path_node(item.node.id)
-                            self.scene.removeItem(item)
-                            self.map_changed.emit()
-                        except ValueError as e:
-                            QMessageBox.warning(self, "Error", str(e))
-
-        else:
-            # Handle other modes
-            self.view.original_mouse_press(event)
-    
-    def handle_mouse_release(self, event):
-        """Handle mouse release events"""
-        if event.button() == Qt.MiddleButton:
-            self.view.original_mouse_release(event)
-        else:
-            self.view.original_mouse_release(event)
-    
-    def handle_mouse_move(self, event):
-        """Handle mouse move events"""
-        if self.view.panning:
-            self.view.original_mouse_move(event)
-        else:
-            self.view.original_mouse_move(event)
+                if dialog.exec_() == QDialog.Accepted:
+                    # Scene units are centimeters with y pointing down
+                    x, y = pos.x(), pos.y()
+                    self._create_path_node(PathNode(x/100, -y/100, direction=direction_input.value()))
+            
+            elif self.path_tool == "delete":
+                # Find and delete clicked node or path
+                item = self._path_node_at(pos)
+                if item is not None:
+                    try:
+                        # Remove node
+                        self.qclass_holder.delete_qpath_node(item.node.id)
+                        self.class_holder.delete_path_node(item.node.id)
+                        self.scene.removeItem(item)
+                        self.map_changed.emit()
+                    except ValueError as e:
+                        QMessageBox.warning(self, "Error", str(e))
+        
+        return True
     
     def update_station_types_list(self):
         """Update the station types list in the side panel"""
-        self.type_list.clear()
-        for station_type in self.station_manager.get_all_types().values():
-            # Create list item with custom widget
-            item = StationTypeItem(station_type)
-            self.type_list.addItem(item)
-            self.type_list.setItemWidget(item, item.custom_widget)
+        station_types = self.station_manager.get_all_types()
+        
+        # Drop rows whose station type no longer exists
+        for row in reversed(range(self.type_list.count())):
+            name = self.type_list.item(row).station_type.name
+            if name not in station_types:
+                self.type_list.takeItem(row)
+                del self._type_items[name]
+        
+        # Keep existing rows, refreshing changed types, and append new ones
+        for name, station_type in station_types.items():
+            item = self._type_items.get(name)
+            if item is None:
+                # Create list item, painted by StationTypeDelegate
+                item = StationTypeItem(station_type)
+                self.type_list.addItem(item)
+                self._type_items[name] = item
+            elif item.station_type is not station_type:
+                item.set_station_type(station_type)
     
     def add_station_type(self):
         """Add a new station type"""
@@ -610,7 +750,7 @@ class MapEditor(QWidget):
                 self.height_spin.value()
             )
             # Set direction
-            station.direction = self.direction_spin.value()
+            station.set_direction(self.direction_spin.value())
             
             try:
                 # Add to resources holder and get UI object
@@ -624,35 +764,21 @@ class MapEditor(QWidget):
             except ValueError as e:
                 QMessageBox.warning(self, "Error", str(e))
     
+    def _schedule_map_size_update(self):
+        """Restart the debounce timer for a map size change"""
+        self._map_size_timer.start()
+    
+    def _apply_map_size(self):
+        """Apply the map size the spin box settled on"""
+        self.update_map_size(self.map_size_spin.value())
+    
     def update_map_size(self, new_size:int):
         """Update the map size and redraw the grid"""
         self.map_size = new_size
         self.update_scene_rect()
         
-        # Get all components from resources holder
-        qstations = self.qclass_holder.get_all_qstations()
-        qpath_nodes = self.qclass_holder.get_all_qpath_nodes()
-        qagvs = self.qclass_holder.get_all_qagvs()
-        
-        # Clear scene and redraw grid
-        self.scene.clear()
-        self.qclass_holder.qpath_nodes.clear()
-        self.qclass_holder.qstations.clear()
-        self.qclass_holder.qagvs.clear()
+        # No item depends on the map size, so only the axes need redrawing
         self._draw_grid()
-        
-        # Re-add all components to scene
-        for qnode in qpath_nodes:
-            qnode = self.qclass_holder.add_qpath_node(qnode)
-            self.scene.addItem(qnode)
-
-        for qstation in qstations:
-            qstation = self.qclass_holder.add_qstation(qstation)
-            self.scene.addItem(qstation)
-
-        for qagv in qagvs:
-            qagv = self.qclass_holder.add_qagv(qagv)
-            self.scene.addItem(qagv)
 
         self.map_changed.emit()
         self.map_size_changed.emit(new_size)  # Emit signal with new size
@@ -665,60 +791,69 @@ class MapEditor(QWidget):
     
     def _draw_grid(self):
         """Draw background grid and coordinate axes"""
-        # Draw grid (1 meter spacing) with darker color for better visibility
-        grid_pen = QPen(QColor("#333333"))  # Darker grid lines
-        grid_pen.setWidth(1)
-        
-        # Draw vertical and horizontal grid lines every meter
-        for i in range(-self.map_size, self.map_size + 1):
-            # Convert meters to scene units (100 units = 1 meter)
-            pos = i * 100
-            self.scene.addLine(pos, -self.map_size * 100, pos, self.map_size * 100, grid_pen)
-            self.scene.addLine(-self.map_size * 100, pos, self.map_size * 100, pos, grid_pen)
+        # Replace the axes drawn for the previous map size
+        for item in self._axis_items:
+            self.scene.removeItem(item)
+        self._axis_items = self._add_grid_items()
+    
+    def _grid_brush(self) -> QBrush:
+        """Get the background brush that tiles one 1 meter grid cell"""
+        if self._grid_pixmap is None:
+            # One cell in scene units (100 units = 1 meter), with its top and
+            # left edges drawn so the tiles line up on every meter
+            pixmap = QPixmap(100, 100)
+            pixmap.fill(QColor("#1e1e1e"))  # Dark gray background
+            painter = QPainter(pixmap)
+            painter.setPen(QPen(QColor("#333333"), 1))  # Darker grid lines
+            painter.drawLine(0, 0, 99, 0)
+            painter.drawLine(0, 0, 0, 99)
+            painter.end()
+            self._grid_pixmap = pixmap
+        return QBrush(self._grid_pixmap)
+    
+    def _add_grid_items(self) -> list:
+        """Add the grid background, axes and axis labels to the scene and return the added items"""
+        # Draw grid (1 meter spacing) as a tiled background instead of line items
+        self.scene.setBackgroundBrush(self._grid_brush())
         
         # Draw coordinate axes with brighter colors
-        axis_pen = QPen(Qt.white)  # White for better visibility
-        axis_pen.setWidth(2)
+        end = self.map_size * 100
+        arrow_size = 20  # Arrow size in scene units
         
         # X-axis (bright red)
-        x_axis = self.scene.addLine(-self.map_size * 100, 0, self.map_size * 100, 0, QPen(QColor("#FF6B6B"), 2))
+        x_axis = self.scene.addLine(-end, 0, end, 0, QPen(QColor("#FF6B6B"), 2))
         # Add arrow for X-axis
-        arrow_size = 20  # Arrow size in scene units
         x_arrow = self.scene.addPolygon(
-            QPolygonF([
-                QPointF(self.map_size * 100 - arrow_size, -arrow_size/2),
-                QPointF(self.map_size * 100, 0),
-                QPointF(self.map_size * 100 - arrow_size, arrow_size/2)
-            ]),
+            QTransform().translate(end, 0).scale(arrow_size, arrow_size).map(self._UNIT_ARROW),
             QPen(QColor("#FF6B6B")),
             QBrush(QColor("#FF6B6B"))
         )
         # X-axis label with brighter color
-        x_label = self.scene.addText("X")
-        x_label.setDefaultTextColor(QColor("#FF6B6B"))
-        x_label.setPos(self.map_size * 100 + 10, 5)
+        x_label = self._add_axis_label("X", QColor("#FF6B6B"), end + 10, 5)
         
         # Y-axis (bright green)
-        y_axis = self.scene.addLine(0, -self.map_size * 100, 0, self.map_size * 100, QPen(QColor("#4ADE80"), 2))
-        # Add arrow for Y-axis
+        y_axis = self.scene.addLine(0, -end, 0, end, QPen(QColor("#4ADE80"), 2))
+        # Add arrow for Y-axis, pointing up the screen
         y_arrow = self.scene.addPolygon(
-            QPolygonF([
-                QPointF(-arrow_size/2, -self.map_size * 100 + arrow_size),
-                QPointF(0, -self.map_size * 100),
-                QPointF(arrow_size/2, -self.map_size * 100 + arrow_size)
-            ]),
+            QTransform().translate(0, -end).rotate(-90).scale(arrow_size, arrow_size).map(self._UNIT_ARROW),
             QPen(QColor("#4ADE80")),
             QBrush(QColor("#4ADE80"))
         )
         # Y-axis label with brighter color
-        y_label = self.scene.addText("Y")
-        y_label.setDefaultTextColor(QColor("#4ADE80"))
-        y_label.setPos(5, -self.map_size * 100 - 25)
+        y_label = self._add_axis_label("Y", QColor("#4ADE80"), 5, -end - 25)
         
         # Origin label with white color
-        origin_label = self.scene.addText("O")
-        origin_label.setDefaultTextColor(Qt.white)
-        origin_label.setPos(5, 5)
+        origin_label = self._add_axis_label("O", QColor(Qt.white), 5, 5)
+        
+        return [x_axis, x_arrow, x_label, y_axis, y_arrow, y_label, origin_label]
+    
+    def _add_axis_label(self, text: str, color: QColor, x: float, y: float):
+        """Add a plain text axis label, without the rich text document addText builds"""
+        label = self.scene.addSimpleText(text)
+        label.setBrush(QBrush(color))
+        # Offset by the document margin addText used, so labels keep their placement
+        label.setPos(x + 4, y + 4)
+        return label
     
     def save_map(self):
         """Save the current map to a file"""
@@ -758,40 +893,44 @@ class MapEditor(QWidget):
             # Create loader and load map
             loader = MapLoader(self)
             try:
-                # Load the map
-                loader.load_map(file_path)
-                
-                # Update station types list
-                self.update_station_types_list()
-                
-                # Emit map changed signal
-                self.map_changed.emit()
+                # Hold back signals emitted while loading and send one afterwards
+                was_blocked = self.blockSignals(True)
+                try:
+                    # Load the map; this also refreshes the station types list
+                    loader.load_map(file_path)
+                finally:
+                    self.blockSignals(was_blocked)
+                    # Emit map changed signal, a load that fails after parsing may have replaced the map
+                    self.map_changed.emit()
                 
                 QMessageBox.information(self, "Success", "Map loaded successfully!")
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to load map: {str(e)}")
     
     def load_station_mesh(self):
-        """Load an STL mesh file for the selected station"""
-        selected_items = self.scene.selectedItems()
-        if not selected_items:
+        """Load an STL mesh file for the selected stations"""
+        qstations = [item for item in self.scene.selectedItems() if isinstance(item, QStation)]
+        if not qstations:
             QMessageBox.warning(self, "Error", "Please select a station")
             return
         
-        station = selected_items[0]
-        if not isinstance(station, QStation):
-            return
-        
+        # Qt's own dialog stays responsive in large mesh folders where the
+        # native Linux chooser can stall, and ReadOnly skips write checks
         file_name, _ = QFileDialog.getOpenFileName(
             self,
             "Load STL Mesh",
-            "",
-            "STL Files (*.stl)"
+            self._last_mesh_dir,
+            "STL Files (*.stl)",
+            options=QFileDialog.DontUseNativeDialog | QFileDialog.ReadOnly
         )
         
         if file_name:
-            station.set_mesh_path(file_name)
-            self.station_modified.emit(station)
+            self._last_mesh_dir = os.path.dirname(file_name)
+            self._settings.setValue("last_mesh_dir", self._last_mesh_dir)
+            # The real-time view loads the file once in the background for all of them
+            for qstation in qstations:
+                qstation.set_mesh_path(file_name)
+                self.station_modified.emit(qstation)
     
     def show_stations_table(self):
         """Show a table of all stations with delete functionality"""
@@ -801,41 +940,16 @@ class MapEditor(QWidget):
         
         layout = QVBoxLayout(dialog)
         
-        # Create table
-        table = QTableWidget()
-        table.setColumnCount(5)
-        table.setHorizontalHeaderLabels(["Name", "Type", "X", "Y", "Delete"])
+        # Create table over all stations from resources holder
+        model = StationsTableModel(self.qclass_holder.get_all_qstations_snapshot(), dialog)
+        table = QTableView()
+        table.setModel(model)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         
-        # Get all stations from resources holder
-        qstations = self.qclass_holder.get_all_qstations()
-        table.setRowCount(len(qstations))
-        
-        for i, qstation in enumerate(qstations):
-            # Name
-            name_item = QTableWidgetItem(qstation.name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            table.setItem(i, 0, name_item)
-            
-            # Type
-            type_item = QTableWidgetItem(qstation.station_type.name)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-            table.setItem(i, 1, type_item)
-            
-            # Position X
-            x_item = QTableWidgetItem(f"{qstation.position[0]:.2f}")
-            x_item.setFlags(x_item.flags() & ~Qt.ItemIsEditable)
-            table.setItem(i, 2, x_item)
-            
-            # Position Y
-            y_item = QTableWidgetItem(f"{qstation.position[1]:.2f}")
-            y_item.setFlags(y_item.flags() & ~Qt.ItemIsEditable)
-            table.setItem(i, 3, y_item)
-            
-            # Delete button
-            delete_btn = QPushButton("Delete")
-            delete_btn.clicked.connect(lambda checked, s=qstation: self.delete_station(s, dialog))
-            table.setCellWidget(i, 4, delete_btn)
+        # Delete buttons are painted by a delegate instead of one widget per row
+        delete_delegate = ButtonDelegate(table)
+        delete_delegate.clicked.connect(lambda row: self._delete_station_row(model, row))
+        table.setItemDelegateForColumn(4, delete_delegate)
         
         layout.addWidget(table)
         
@@ -846,84 +960,112 @@ class MapEditor(QWidget):
         
         dialog.exec_()
     
-    def delete_station(self, station, dialog:QDialog):
-        """Delete a station after confirmation"""
-        reply = QMessageBox.question(
-            self,
-            "Confirm Delete",
-            f"Are you sure you want to delete station '{station.name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
+    def _delete_station_row(self, model: StationsTableModel, row: int):
+        """Delete the station in a table row and drop just that row"""
+        if self.delete_station(model.qstation(row)):
+            model.remove_row(row)
+    
+    def delete_station(self, qstation: QStation) -> bool:
+        """Delete a station after confirmation, returning True if it was deleted"""
+        station = qstation.station
+        if self._confirm_delete(f"Are you sure you want to delete station '{station.name}'?"):
             try:
-                # Get the UI object before deletion
-                qstation = self.qclass_holder.get_qstation_by_id(station.id)
                 # Remove from resources holder
                 self.class_holder.delete_station(station.id)
                 self.qclass_holder.delete_qstation(station.id)
                 # Remove from scene
-                if qstation:
-                    self.scene.removeItem(qstation)
-                    self.station_removed.emit(qstation)
+                self.scene.removeItem(qstation)
+                self.station_removed.emit(qstation)
                 self.map_changed.emit()
-                # Refresh the stations table
-                dialog.close()
-                self.show_stations_table()
+                return True
             except ValueError as e:
                 QMessageBox.warning(self, "Error", str(e))
+        return False
+    
+    def _confirm_delete(self, text: str) -> bool:
+        """Ask to confirm a station delete, unless the user chose not to be asked again"""
+        if not self._confirm_station_delete:
+            return True
+        
+        box = QMessageBox(QMessageBox.Question, "Confirm Delete", text, QMessageBox.Yes | QMessageBox.No, self)
+        box.setDefaultButton(QMessageBox.No)
+        dont_ask = QCheckBox("Don't ask again")
+        box.setCheckBox(dont_ask)
+        confirmed = box.exec_() == QMessageBox.Yes
+        
+        # Only a confirmed delete can turn the question off
+        if confirmed and dont_ask.isChecked():
+            self._confirm_station_delete = False
+            self._settings.setValue("confirm_station_delete", False)
+        return confirmed
     
     def add_path_node_by_position(self):
         """Add a path node by entering its position"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Add Path Node")
-        dialog.setModal(True)
-        
-        layout = QFormLayout(dialog)
-        
-        # Position inputs
-        x_input = QDoubleSpinBox()
-        x_input.setRange(-500, 500)
-        x_input.setDecimals(2)
-        
-        y_input = QDoubleSpinBox()
-        y_input.setRange(-500, 500)
-        y_input.setDecimals(2)
-        
-        # Add direction input
-        direction_input = QDoubleSpinBox()
-        direction_input.setRange(0, 359.99)
-        direction_input.setDecimals(2)
-        direction_input.setSuffix("°")
-        direction_input.setSingleStep(15.0)
-
-        # add name input
-        name_input = QLineEdit()
-        name_input.setPlaceholderText("Enter node name")
-        
-        layout.addRow("Name:", name_input)
-        layout.addRow("X Position:", x_input)
-        layout.addRow("Y Position:", y_input)
-        layout.addRow("Direction:", direction_input)
-        
-        # Buttons
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
-        )
-        buttons.accepted.connect(dialog.accept)
-        buttons.rejected.connect(dialog.reject)
-        layout.addRow(buttons)
+        dialog, name_input, x_input, y_input, direction_input = self._get_add_node_dialog()
+        # Start every entry from a blank form, as a freshly built dialog would
+        name_input.clear()
+        x_input.setValue(0.0)
+        y_input.setValue(0.0)
+        direction_input.setValue(0.0)
+        name_input.setFocus()
         
         if dialog.exec_() == QDialog.Accepted:
-            # Create backend PathNode first
-            node = PathNode(x_input.value(), y_input.value(), direction=direction_input.value(), name=name_input.text())
-            try:
-                # Add to resources holder and get UI object
-                node = self.class_holder.add_path_node(node)
-                qnode = self.qclass_holder.add_qpath_node(node)
-                # Add to scene
-                self.scene.addItem(qnode)
-                self.map_changed.emit()
-            except ValueError as e:
-                QMessageBox.warning(self, "Error", str(e))
\ No newline at end of file
+            self._create_path_node(PathNode(x_input.value(), y_input.value(), direction=direction_input.value(), name=name_input.text()))
+    
+    def _get_add_node_dialog(self):
+        """Get the reusable add path node dialog and its name, X, Y and direction inputs"""
+        if self._add_node_dialog is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle("Add Path Node")
+            dialog.setModal(True)
+            
+            layout = QFormLayout(dialog)
+            
+            # Position inputs
+            x_input = QDoubleSpinBox()
+            x_input.setRange(-500, 500)
+            x_input.setDecimals(2)
+            
+            y_input = QDoubleSpinBox()
+            y_input.setRange(-500, 500)
+            y_input.setDecimals(2)
+            
+            # Add direction input
+            direction_input = QDoubleSpinBox()
+            direction_input.setRange(0, 359.99)
+            direction_input.setDecimals(2)
+            direction_input.setSuffix("°")
+            direction_input.setSingleStep(15.0)
+            
+            # add name input
+            name_input = QLineEdit()
+            name_input.setPlaceholderText("Enter node name")
+            
+            layout.addRow("Name:", name_input)
+            layout.addRow("X Position:", x_input)
+            layout.addRow("Y Position:", y_input)
+            layout.addRow("Direction:", direction_input)
+            
+            # Buttons
+            buttons = QDialogButtonBox(
+                QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+            )
+            buttons.accepted.connect(dialog.accept)
+            buttons.rejected.connect(dialog.reject)
+            layout.addRow(buttons)
+            
+            self._add_node_dialog = (dialog, name_input, x_input, y_input, direction_input)
+        return self._add_node_dialog
+    
+    def _create_path_node(self, node: PathNode):
+        """Add a new path node to the backend, the UI holder and the scene"""
+        try:
+            # Backend assigns the id, then the UI object picks up direction from the node
+            node = self.class_holder.add_path_node(node)
+            qnode = self.qclass_holder.add_qpath_node(node)
+            self.scene.addItem(qnode)
+            self.map_changed.emit()
+            return qnode
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", str(e))
+            return None
\ No newline at end of file
@@ -1,16 +1,76 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QProgressDialog
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QProgressBar
 from PySide6.QtOpenGLWidgets import QOpenGLWidget
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QColor
 from OpenGL.GL import *
 from OpenGL.GLU import *
 import numpy as np
-from math import cos, sin, pi
+from math import cos, sin, pi, radians
+from functools import lru_cache
+import os
+import struct
 import trimesh
 from components.station import QStation
 from components.qclass_holder import QClassHolder
 from components.agv import AGV
 
+@lru_cache(maxsize=None)
+def color_rgbf(color: str) -> tuple[float, float, float]:
+    """Convert a color string to an (r, g, b) tuple of floats, once per distinct string"""
+    qcolor = QColor(color)
+    return (qcolor.redF(), qcolor.greenF(), qcolor.blueF())
+
+# One binary STL triangle: normal, three vertices and an attribute byte count
+_STL_RECORD = np.dtype([('normal', '<f4', 3), ('vertices', '<f4', (3, 3)), ('attr', '<u2')])
+_STL_HEADER_SIZE = 84  # 80 byte header plus the uint32 triangle count
+
+def load_mesh_arrays(path: str):
+    """Load a mesh file as (vertices, faces) arrays, reading binary STL in one pass"""
+    with open(path, 'rb') as f:
+        header = f.read(_STL_HEADER_SIZE)
+    if len(header) == _STL_HEADER_SIZE:
+        count = struct.unpack('<I', header[80:84])[0]
+        # Only a binary STL has exactly one 50 byte record per counted triangle
+        if os.path.getsize(path) == _STL_HEADER_SIZE + count * _STL_RECORD.itemsize:
+            records = np.fromfile(path, dtype=_STL_RECORD, count=count, offset=_STL_HEADER_SIZE)
+            vertices = records['vertices'].reshape(-1, 3)
+            faces = np.arange(len(vertices)).reshape(-1, 3)
+            return vertices, faces
+    
+    # ASCII STL and other formats
+    mesh = trimesh.load(path)
+    return mesh.vertices, mesh.faces
+
+def flat_shaded_arrays(vertices, faces):
+    """Expand an indexed mesh into per-corner position and face normal arrays for glDrawArrays"""
+    triangles = np.asarray(vertices, dtype=np.float32)[np.asarray(faces)]  # (F, 3, 3)
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    # Degenerate triangles keep a zero normal instead of dividing by zero
+    normals /= np.where(lengths > 0, lengths, 1)
+    corner_normals = np.repeat(normals, 3, axis=0)
+    return np.ascontiguousarray(triangles.reshape(-1, 3)), np.ascontiguousarray(corner_normals, dtype=np.float32)
+
+class MeshLoadSignals(QObject):
+    """Signals reporting the result of a background mesh load"""
+    loaded = Signal(str, object, object)  # path, per-corner positions, per-corner normals
+    failed = Signal(str, str)  # path, error message
+
+class MeshLoader(QRunnable):
+    """Thread pool task that reads and parses one mesh file"""
+    def __init__(self, path: str, signals: MeshLoadSignals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+    
+    def run(self):
+        try:
+            # Flatten in the worker too, so the render loop only hands arrays to GL
+            vertices, normals = flat_shaded_arrays(*load_mesh_arrays(self.path))
+            self.signals.loaded.emit(self.path, vertices, normals)
+        except Exception as e:
+            self.signals.failed.emit(self.path, str(e))
+
 class RealtimeView(QWidget):
     def __init__(self, qclass_holder: QClassHolder):
         super().__init__()
@@ -20,8 +80,15 @@ class RealtimeView(QWidget):
         
         # Dictionary to store loaded meshes
         self.station_meshes = {}
-        
-        # Set up animation timer
+        # Meshes being loaded in the background, station name -> path
+        self._pending_meshes = {}
+        # Created on the GUI thread, so worker emissions are queued to it
+        self._mesh_signals = MeshLoadSignals(self)
+        self._mesh_signals.loaded.connect(self._on_mesh_loaded)
+        self._mesh_signals.failed.connect(self._on_mesh_failed)
+        
+        # Set up animation timer, which only redraws when AGVs have moved
+        self._last_agv_poses = None
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_positions)
         self.timer.start(50)  # Update every 50ms
@@ -31,45 +98,76 @@ class RealtimeView(QWidget):
         layout = QVBoxLayout(self)
         self.gl_widget = GLWidget(self.qclass_holder)
         layout.addWidget(self.gl_widget)
+        
+        # Busy indicator shown while meshes load in the background
+        self.mesh_progress = QProgressBar()
+        self.mesh_progress.setRange(0, 0)
+        self.mesh_progress.setFormat("Loading mesh...")
+        self.mesh_progress.setTextVisible(True)
+        self.mesh_progress.hide()
+        layout.addWidget(self.mesh_progress)
     
     def update_positions(self):
-        """Update AGV positions from resources holder"""
-        # Update the GL widget
-        self.gl_widget.update()
+        """Redraw the GL widget if any AGV has moved since the last check"""
+        # Camera, station, mesh, map size and map edits request their own
+        # redraws, so AGV motion is the only change polled for here
+        if not self.isVisible():
+            return
+        class_holder = self.qclass_holder.class_holder
+        agv_poses = class_holder.poses_array(class_holder.get_all_agvs())
+        if self._last_agv_poses is None or not np.array_equal(agv_poses, self._last_agv_poses):
+            self._last_agv_poses = agv_poses
+            self.gl_widget.update()
     
     def update_station(self, qstation: QStation):
         """Update a station in the 3D view"""
-        # Load mesh if available
-        if qstation.station.size.mesh_path:
-            try:
-                progress = QProgressDialog("Loading mesh...", None, 0, 100, self)
-                progress.setWindowModality(Qt.WindowModal)
-                progress.show()
-                
-                # Load the mesh using trimesh
-                mesh = trimesh.load(qstation.station.size.mesh_path)
-                vertices = mesh.vertices
-                faces = mesh.faces
-                
-                # Store the mesh data
-                self.station_meshes[qstation.station.name] = {
-                    'vertices': vertices,
-                    'faces': faces
-                }
-                
-                progress.close()
-            except Exception as e:
-                print(f"Error loading mesh: {e}")
+        # Load mesh if available, off the GUI thread
+        station = qstation.station
+        path = station.mesh_path
+        if path and self._pending_meshes.get(station.name) != path:
+            # Stations sharing a mesh file wait on a single load of it
+            already_loading = path in self._pending_meshes.values()
+            self._pending_meshes[station.name] = path
+            if not already_loading:
+                self.mesh_progress.show()
+                QThreadPool.globalInstance().start(MeshLoader(path, self._mesh_signals))
         
         # Force update
         self.gl_widget.update()
+    
+    def _on_mesh_loaded(self, path: str, vertices, normals):
+        """Store a mesh finished by a background load for every station still waiting on it"""
+        mesh_data = {
+            'vertices': vertices,
+            'normals': normals
+        }
+        for station_name in self._finish_mesh_load(path):
+            self.station_meshes[station_name] = mesh_data
+        self.gl_widget.update()
+    
+    def _on_mesh_failed(self, path: str, error: str):
+        """Report a failed background mesh load"""
+        if self._finish_mesh_load(path):
+            print(f"Error loading mesh: {error}")
+    
+    def _finish_mesh_load(self, path: str) -> list[str]:
+        """Mark a background load done, returning the stations still waiting on it"""
+        # Stations removed or given another mesh meanwhile are no longer listed
+        station_names = [name for name, pending in self._pending_meshes.items() if pending == path]
+        for station_name in station_names:
+            del self._pending_meshes[station_name]
+        if not self._pending_meshes:
+            self.mesh_progress.hide()
+        return station_names
 
     def remove_station(self, qstation: QStation):
         """Remove a station's mesh data"""
         station_name = qstation.station.name
-        # Remove station mesh if it exists
+        # Remove station mesh if it exists, and drop any load still running
         if station_name in self.station_meshes:
             del self.station_meshes[station_name]
+        if self._pending_meshes.pop(station_name, None) is not None and not self._pending_meshes:
+            self.mesh_progress.hide()
         
         # Force update
         self.gl_widget.update()
@@ -93,6 +191,12 @@ class GLWidget(QOpenGLWidget):
         self.model_matrix = np.identity(4, dtype=np.float32)
         self.view_matrix = np.identity(4, dtype=np.float32)
         self.projection_matrix = np.identity(4, dtype=np.float32)
+        # Scratch buffers reused by _load_model_matrix for every object drawn
+        self._model_buffer = np.identity(4, dtype=np.float32)
+        self._modelview_buffer = np.empty((4, 4), dtype=np.float32)
+        # Inverse view-projection for _screen_to_world, with the matrices it was computed from
+        self._vp_inverse = None
+        self._vp_inverse_source = (None, None)
         
         # Set zoom limits and speed
         self.min_zoom = 2.0  # Minimum zoom distance
@@ -103,15 +207,26 @@ class GLWidget(QOpenGLWidget):
         
         # Set initial map size
         self.map_size = 10  # Default 10m x 10m grid
+        
+        # Compiled display lists for static geometry, owned by the current GL context
+        self._display_lists = {}  # (shape, dimensions...) -> list id
+        self._grid_list = None
+        self._grid_list_size = None  # Map size the grid list was compiled for
     
     def initializeGL(self):
         """Initialize OpenGL settings"""
+        # A new context starts without any of our display lists
+        self._display_lists = {}
+        self._grid_list = None
+        self._grid_list_size = None
+        
         glClearColor(0.95, 0.95, 0.95, 1.0)
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_LIGHTING)
         glEnable(GL_LIGHT0)
         glEnable(GL_COLOR_MATERIAL)
-        glEnable(GL_NORMALIZE)
+        # GL_NORMALIZE stays off: every normal is emitted at unit length and the
+        # modelview only rotates and translates, except around scaled boxes
         
         # Set up light
         glLight(GL_LIGHT0, GL_POSITION, (5.0, 5.0, 5.0, 1.0))
@@ -144,39 +259,43 @@ class GLWidget(QOpenGLWidget):
         
         # Draw stations from resources holder
         qstations = self.qclass_holder.get_all_qstations()
+        port_nodes = []
         for qstation in qstations:
             self._draw_station(qstation)
-        
-        # Draw path nodes from resources holder
-        qpath_nodes = self.qclass_holder.get_all_qpath_nodes()
-        for qnode in qpath_nodes:
-            self._draw_path_node(qnode)
-        
-        # Draw AGVs from resources holder
-        agvs = self.qclass_holder.get_all_qagvs()
-        for agv in agvs:
-            # Create model matrix for this AGV
-            model = np.identity(4, dtype=np.float32)
-            pos = agv.position
-            
-            # Translation matrix
-            trans = np.identity(4, dtype=np.float32)
-            trans[0:3, 3] = [float(pos[0]), float(pos[1]), 0.1]  # Slightly above ground
-            model = np.dot(model, trans)
-            
-            # Rotation matrix around Z axis
-            rot = np.identity(4, dtype=np.float32)
-            angle = np.radians(agv.direction)
-            rot[0:2, 0:2] = [[np.cos(angle), -np.sin(angle)],
-                            [np.sin(angle), np.cos(angle)]]
-            model = np.dot(model, rot)
-            
-            # Apply model-view matrix
-            modelview = np.dot(self.view_matrix, model)
-            glLoadMatrixf(modelview.T)
-            
-            # Draw AGV
-            self._draw_agv(agv)
+            if qstation.qport:
+                port_nodes.append(qstation.qport.node)
+        
+        # Draw station ports as light gray markers with green arrows
+        class_holder = self.qclass_holder.class_holder
+        self._draw_markers(class_holder.poses_array(port_nodes), (0.7, 0.7, 0.7), (0.0, 0.7, 0.0))
+        
+        # Draw path nodes from resources holder as gray markers with red arrows
+        self._draw_markers(class_holder.get_path_node_poses(), (0.4, 0.4, 0.4), (1.0, 0.0, 0.0))
+        
+        # Draw AGVs from resources holder, slightly above ground, with an initial
+        # -90 degree rotation folded into their direction to align with correct orientation
+        agvs = class_holder.get_all_agvs()
+        if agvs:
+            modelviews = self._batch_modelviews(class_holder.poses_array(agvs), 0.1, -90)
+            for agv, modelview in zip(agvs, modelviews):
+                glLoadMatrixf(modelview)
+                self._draw_agv(agv)
+    
+    def _load_model_matrix(self, x, y, z, degrees):
+        """Load view * translate(x, y, z) * rotate_z(degrees) as the modelview matrix"""
+        angle = radians(degrees)
+        c, s = cos(angle), sin(angle)
+        # Only the rotation and translation entries change; the rest stay identity
+        model = self._model_buffer
+        model[0, 0] = c
+        model[0, 1] = -s
+        model[1, 0] = s
+        model[1, 1] = c
+        model[0, 3] = x
+        model[1, 3] = y
+        model[2, 3] = z
+        np.matmul(self.view_matrix, model, out=self._modelview_buffer)
+        glLoadMatrixf(self._modelview_buffer.T)
     
     def _perspective_matrix(self, fovy, aspect, near, far):
         """Create perspective projection matrix"""
@@ -226,50 +345,21 @@ class GLWidget(QOpenGLWidget):
     
     def _draw_station(self, qstation: QStation):
         """Draw a station with its custom size or mesh"""
-        # Create model matrix for this station
-        model = np.identity(4, dtype=np.float32)
+        # Place the station on the x-y plane, with an initial -90 degree
+        # rotation folded into its direction to align with correct orientation
         pos = qstation.station.position
-        # Convert scene coordinates to meters
-        x = float(pos[0])
-        y = float(pos[1])
-        
-        # Translation matrix for station position
-        trans = np.identity(4, dtype=np.float32)
-        trans[0:3, 3] = [x, y, 0]  # Map coordinates to x-y plane
-        model = np.dot(model, trans)  # Apply translation
-        
-        # Rotation matrix for direction
-        # Add initial -90 degree rotation to align with correct orientation
-        initial_angle = np.radians(-90)
-        rot_initial = np.identity(4, dtype=np.float32)
-        rot_initial[0:2, 0:2] = [[np.cos(initial_angle), -np.sin(initial_angle)],
-                                [np.sin(initial_angle), np.cos(initial_angle)]]
-        model = np.dot(model, rot_initial)  # Apply initial rotation
-        
-        # Apply station's direction rotation
-        rot = np.identity(4, dtype=np.float32)
-        angle = np.radians(qstation.station.direction)
-        rot[0:2, 0:2] = [[np.cos(angle), -np.sin(angle)],
-                         [np.sin(angle), np.cos(angle)]]
-        model = np.dot(model, rot)  # Apply direction rotation
-        
-        # Apply model-view matrix
-        modelview = np.dot(self.view_matrix, model)
-        glLoadMatrixf(modelview.T)
+        self._load_model_matrix(float(pos[0]), float(pos[1]), 0, qstation.station.direction - 90)
         
         # Set station color
-        color = QColor(qstation.station.station_type.color)
-        glColor3f(color.redF(), color.greenF(), color.blueF())
+        glColor3f(*color_rgbf(qstation.station.station_type.color))
         
         if qstation.station.name in self.parent().station_meshes:
             # Draw custom mesh if available
             mesh_data = self.parent().station_meshes[qstation.station.name]
-            self._draw_mesh(mesh_data['vertices'], mesh_data['faces'])
+            self._draw_mesh(mesh_data['vertices'], mesh_data['normals'])
         else:
-            # Draw box with custom size (convert to meters)
-            w = qstation.station.size.width
-            l = qstation.station.size.length
-            h = qstation.station.size.height
+            # Draw box with custom size in meters
+            w, l, h = qstation.station.size
             
             # Draw box with proper orientation
             # Note: width along x, length along y, height along z
@@ -299,67 +389,30 @@ class GLWidget(QOpenGLWidget):
             glEnd()
             
             glPopMatrix()  # Restore matrix
-
-        # Draw port if it exists
-        if qstation.qport:
-            # Save current matrix
-            glPushMatrix()
-            
-            # Reset to view matrix for port position
-            glLoadMatrixf(self.view_matrix.T)
-            
-            # Get port position
-            port_pos = qstation.qport.node.position
-            port_direction = qstation.qport.node.direction
-            
-            # Create port model matrix
-            port_model = np.identity(4, dtype=np.float32)
-            
-            # Translate to port position
-            port_trans = np.identity(4, dtype=np.float32)
-            port_trans[0:3, 3] = [float(port_pos[0]), float(port_pos[1]), 0.1]  # Slightly above ground
-            port_model = np.dot(port_model, port_trans)
-            
-            # Rotate for port direction
-            port_rot = np.identity(4, dtype=np.float32)
-            port_angle = np.radians(port_direction)
-            port_rot[0:2, 0:2] = [[np.cos(port_angle), -np.sin(port_angle)],
-                                [np.sin(port_angle), np.cos(port_angle)]]
-            port_model = np.dot(port_model, port_rot)
-            
-            # Apply port model-view matrix
-            port_modelview = np.dot(self.view_matrix, port_model)
-            glLoadMatrixf(port_modelview.T)
-            
-            # Draw port as a cylinder with arrow
-            glColor3f(0.7, 0.7, 0.7)  # Light gray color for port
-            self._draw_cylinder(0.1, 0.1)  # radius=0.1m, height=0.1m
-            
-            # Draw direction arrow on top of cylinder
-            glColor3f(0.0, 0.7, 0.0)  # Green color for port arrow
-            glTranslatef(0, 0, 0.1+0.01)  # Move to top of cylinder
-            
-            # Draw arrow
-            arrow_length = 0.15  # 15cm
-            arrow_width = 0.05   # 5cm
-            
-            glBegin(GL_TRIANGLES)
-            glNormal3f(0, 0, 1)  # Normal pointing up
-            # Arrow pointing in positive X direction
-            glVertex3f(0, 0, 0)  # Base center
-            glVertex3f(arrow_length, 0, 0)  # Tip
-            glVertex3f(0, arrow_width/2, 0)  # Right point
-            
-            glVertex3f(0, 0, 0)  # Base center
-            glVertex3f(arrow_length, 0, 0)  # Tip
-            glVertex3f(0, -arrow_width/2, 0)  # Left point
-            glEnd()
-            
-            # Restore matrix
-            glPopMatrix()
+    
+    def _call_list(self, key, emit, *args):
+        """Draw geometry from a compiled display list, compiling it with emit(*args) on first use"""
+        gl_list = self._display_lists.get(key)
+        if gl_list is None:
+            gl_list = glGenLists(1)
+            glNewList(gl_list, GL_COMPILE)
+            emit(*args)
+            glEndList()
+            self._display_lists[key] = gl_list
+        glCallList(gl_list)
     
     def _draw_box(self, width, height, length):
-        """Draw a box with given dimensions in meters
+        """Draw a box with given dimensions in meters by scaling one shared unit box display list"""
+        glPushMatrix()
+        glScalef(width, length, height)
+        # The scale is not uniform, so the face normals need renormalizing
+        glEnable(GL_NORMALIZE)
+        self._call_list(('box',), self._emit_box, 1.0, 1.0, 1.0)
+        glDisable(GL_NORMALIZE)
+        glPopMatrix()
+    
+    def _emit_box(self, width, height, length):
+        """Emit the vertices of a box with given dimensions in meters
         width: along x-axis
         height: along z-axis
         length: along y-axis
@@ -400,23 +453,30 @@ class GLWidget(QOpenGLWidget):
                 glVertex3fv(vertices[vertex_idx])
         glEnd()
     
-    def _draw_mesh(self, vertices, faces):
-        """Draw a mesh from vertices and faces"""
-        glBegin(GL_TRIANGLES)
-        for face in faces:
-            # Calculate face normal for proper lighting
-            v1, v2, v3 = [vertices[i] for i in face]
-            normal = np.cross(v2 - v1, v3 - v1)
-            normal = normal / np.linalg.norm(normal)
-            glNormal3fv(normal)
-            
-            # Draw face vertices
-            for vertex_idx in face:
-                glVertex3fv(vertices[vertex_idx])
-        glEnd()
+    def _draw_mesh(self, vertices, normals):
+        """Draw a mesh from per-corner float32 positions and normals in a single call"""
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, vertices)
+        glNormalPointer(GL_FLOAT, 0, normals)
+        glDrawArrays(GL_TRIANGLES, 0, len(vertices))
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
     
     def _draw_grid(self):
-        """Draw the floor grid with consistent units"""
+        """Draw the floor grid and axes, recompiling their display list when the map size changes"""
+        if self._grid_list_size != self.map_size:
+            if self._grid_list is not None:
+                glDeleteLists(self._grid_list, 1)
+            self._grid_list = glGenLists(1)
+            glNewList(self._grid_list, GL_COMPILE)
+            self._emit_grid()
+            glEndList()
+            self._grid_list_size = self.map_size
+        glCallList(self._grid_list)
+    
+    def _emit_grid(self):
+        """Emit the floor grid with consistent units"""
         glDisable(GL_LIGHTING)  # Disable lighting for grid
         
         # Draw main grid with current map size
@@ -447,34 +507,44 @@ class GLWidget(QOpenGLWidget):
         
         glEnable(GL_LIGHTING)  # Re-enable lighting
     
-    def _draw_path_node(self, qnode):
-        """Draw a path node with consistent units"""
-        # Create model matrix for this node
-        model = np.identity(4, dtype=np.float32)
-        pos = qnode.node.position
-        
-        # Translation matrix
-        trans = np.identity(4, dtype=np.float32)
-        trans[0:3, 3] = [float(pos[0]), float(pos[1]), 0.1]  # Slightly above ground
-        model = np.dot(model, trans)
-        
-        # Rotation matrix for direction
-        rot = np.identity(4, dtype=np.float32)
-        angle = np.radians(qnode.node.direction)
-        rot[0:2, 0:2] = [[np.cos(angle), -np.sin(angle)],
-                         [np.sin(angle), np.cos(angle)]]
-        model = np.dot(model, rot)
-        
-        # Apply model-view matrix
-        modelview = np.dot(self.view_matrix, model)
-        glLoadMatrixf(modelview.T)
-        
-        # Draw cylinder
-        glColor3f(0.4, 0.4, 0.4)  # Gray color for cylinder
-        self._draw_cylinder(0.1, 0.1)  # radius=0.1m, height=0.1m
+    def _draw_markers(self, poses: np.ndarray, body_color, arrow_color):
+        """Draw a cylinder marker with a direction arrow at each row of an (N, 3) array of (x, y, direction) poses"""
+        if not len(poses):
+            return
+        
+        # Markers sit slightly above ground, rotated by their direction
+        key = ('marker', body_color, arrow_color)
+        for modelview in self._batch_modelviews(poses, 0.1):
+            glLoadMatrixf(modelview)
+            self._call_list(key, self._emit_marker, body_color, arrow_color)
+    
+    def _batch_modelviews(self, poses: np.ndarray, z: float, angle_offset: float = 0.0) -> np.ndarray:
+        """Build view * translate(x, y, z) * rotate_z(direction + angle_offset) for every (x, y, direction) row
+        
+        Returns an (N, 4, 4) array already transposed to the column-major
+        layout glLoadMatrixf expects.
+        """
+        angles = np.radians(poses[:, 2] + angle_offset)
+        cos_a, sin_a = np.cos(angles), np.sin(angles)
+        models = np.zeros((len(poses), 4, 4), dtype=np.float32)
+        models[:, 0, 0] = cos_a
+        models[:, 0, 1] = -sin_a
+        models[:, 1, 0] = sin_a
+        models[:, 1, 1] = cos_a
+        models[:, 2, 2] = 1.0
+        models[:, 3, 3] = 1.0
+        models[:, 0, 3] = poses[:, 0]
+        models[:, 1, 3] = poses[:, 1]
+        models[:, 2, 3] = z
+        return np.ascontiguousarray(np.matmul(self.view_matrix, models).transpose(0, 2, 1))
+    
+    def _emit_marker(self, body_color, arrow_color):
+        """Emit a path node or port marker: a cylinder with an arrow along positive X on top"""
+        glColor3f(*body_color)
+        self._emit_cylinder(0.1, 0.1)  # radius=0.1m, height=0.1m
         
         # Draw direction arrow on top of cylinder
-        glColor3f(1.0, 0.0, 0.0)  # Red color for arrow
+        glColor3f(*arrow_color)
         glTranslatef(0, 0, 0.1+0.01)  # Move to top of cylinder
         
         # Draw arrow
@@ -482,7 +552,7 @@ class GLWidget(QOpenGLWidget):
         arrow_width = 0.05   # 5cm
         
         glBegin(GL_TRIANGLES)
-        # Arrow pointing in positive X direction (will be rotated by node direction)
+        glNormal3f(0, 0, 1)  # Normal pointing up
         glVertex3f(0, 0, 0)  # Base center
         glVertex3f(arrow_length, 0, 0)  # Tip
         glVertex3f(0, arrow_width/2, 0)  # Right point
@@ -492,8 +562,8 @@ class GLWidget(QOpenGLWidget):
         glVertex3f(0, -arrow_width/2, 0)  # Left point
         glEnd()
     
-    def _draw_cylinder(self, radius, height):
-        """Draw a cylinder with the specified dimensions in meters"""
+    def _emit_cylinder(self, radius, height):
+        """Emit the vertices of a cylinder with the specified dimensions in meters"""
         sides = 32
         step = 2 * pi / sides
         
@@ -522,42 +592,14 @@ class GLWidget(QOpenGLWidget):
             glEnd()
     
     def _draw_agv(self, agv: AGV):
-        """Draw an AGV with its dimensions and color"""
+        """Draw an AGV with its dimensions and color, in the modelview already loaded for it"""
         # Get AGV dimensions in meters
         width = agv.size[0]
         length = agv.size[1]
         height = agv.size[2]
         
         # Set AGV color based on status
-        color = QColor("#4287f5")
-        glColor3f(color.redF(), color.greenF(), color.blueF())
-        
-        # Create model matrix for this AGV
-        model = np.identity(4, dtype=np.float32)
-        pos = agv.position
-        
-        # Translation matrix
-        trans = np.identity(4, dtype=np.float32)
-        trans[0:3, 3] = [float(pos[0]), float(pos[1]), 0.1]  # Slightly above ground
-        model = np.dot(model, trans)
-        
-        # Add initial -90 degree rotation to align with correct orientation
-        initial_angle = np.radians(-90)
-        rot_initial = np.identity(4, dtype=np.float32)
-        rot_initial[0:2, 0:2] = [[np.cos(initial_angle), -np.sin(initial_angle)],
-                                [np.sin(initial_angle), np.cos(initial_angle)]]
-        model = np.dot(model, rot_initial)  # Apply initial rotation
-        
-        # Rotation matrix for AGV direction
-        rot = np.identity(4, dtype=np.float32)
-        angle = np.radians(agv.direction)
-        rot[0:2, 0:2] = [[np.cos(angle), -np.sin(angle)],
-                         [np.sin(angle), np.cos(angle)]]
-        model = np.dot(model, rot)  # Apply direction rotation
-        
-        # Apply model-view matrix
-        modelview = np.dot(self.view_matrix, model)
-        glLoadMatrixf(modelview.T)
+        glColor3f(*color_rgbf("#4287f5"))
         
         # Draw AGV body - width along x, length along y, height along z
         self._draw_box(width, height, length)
@@ -592,9 +634,13 @@ class GLWidget(QOpenGLWidget):
         x = (2.0 * screen_x / self.width()) - 1.0
         y = 1.0 - (2.0 * screen_y / self.height())
             
-        # Create combined view-projection matrix
-        vp_matrix = np.dot(self.projection_matrix, self.view_matrix)
-        vp_inverse = np.linalg.inv(vp_matrix)
+        # Invert the combined view-projection matrix only when paintGL or
+        # resizeGL has replaced one of them, not on every mouse event
+        source_projection, source_view = self._vp_inverse_source
+        if source_projection is not self.projection_matrix or source_view is not self.view_matrix:
+            self._vp_inverse = np.linalg.inv(np.dot(self.projection_matrix, self.view_matrix))
+            self._vp_inverse_source = (self.projection_matrix, self.view_matrix)
+        vp_inverse = self._vp_inverse
             
         # Create ray in homogeneous coordinates
         ray_clip = np.array([x, y, -1.0, 1.0], dtype=np.float32)
@@ -611,13 +657,6 @@ class GLWidget(QOpenGLWidget):
             
         return ray_world[:3]
 
-    def mousePressEvent(self, event):
-        """Handle mouse press events"""
-        self.last_pos = event.pos()
-        if event.button() == Qt.MiddleButton:
-            # Store initial pan position
-            self.pan_start_pos = self._screen_to_world(event.pos().x(), event.pos().y())
-
     def wheelEvent(self, event):
         """Handle mouse wheel events for zooming while keeping the screen center point unchanged on the plane."""
         # Determine the zoom direction based on wheel movement
@@ -712,7 +751,7 @@ class GLWidget(QOpenGLWidget):
             # Reset the pan start position when middle button is released
             self.pan_start_pos = None
 
-        def update_map_size(self, new_size):
-            """Update the map size and redraw"""
-            self.map_size = new_size
-            self.update()  # Force redraw
\ No newline at end of file
+    def update_map_size(self, new_size):
+        """Update the map size and redraw"""
+        self.map_size = new_size
+        self.update()  # Force redraw
\ No newline at end of file